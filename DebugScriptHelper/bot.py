@@ -1,15 +1,22 @@
 #!/usr/bin/env python3
 
 import discord
+import aiohttp
 from discord import app_commands, ui
 from discord.ext import commands
 import asyncio
 from datetime import datetime, timedelta
 import logging
 import sys
+import os
+import tempfile
+import zipfile
+import time
+import re
+import atexit
 import csv
 import io
-import copy
+from collections import namedtuple, OrderedDict, defaultdict
 
 import pickle
 
@@ -21,8 +28,10 @@ from config import (
 )
 from utils import (
     load_data, save_data, format_event_details, format_event_list, 
-    has_role, parse_date, logger, send_to_log_channel, discord_handler,
-    generate_team_id, export_log_file, clear_log_file, import_log_file
+    has_role, parse_date, parse_date_fast, logger, send_to_log_channel, discord_handler,
+    generate_team_id, export_log_file, clear_log_file, import_log_stream,
+    refresh_event_metadata, get_waitlist_index, mark_waitlist_changed, get_sorted_team_names,
+    make_waitlist_entry, SCHEMA_LEGACY, SCHEMA_V2
 )
 
 # Check if token is available
@@ -45,6 +54,11 @@ class EventBot(commands.Bot):
     async def setup_hook(self):
         await self.tree.sync()
         logger.info("Slash commands synced")
+    
+    async def close(self):
+        # Ausstehende Änderungen vor dem Beenden speichern
+        flush_save()
+        await super().close()
 
 bot = EventBot()
 
@@ -52,7 +66,91 @@ bot = EventBot()
 event_data, channel_id, user_team_assignments = load_data()
 team_requester = {}  # Store users who requested waitlist spots
 
+# Maximale Anzahl gleichzeitiger Discord-API-Abrufe (z.B. fetch_user)
+FETCH_CONCURRENCY = 10
+
+# Blockgröße beim Herunterladen von Log-Dateien für /import_log
+LOG_IMPORT_CHUNK_SIZE = 64 * 1024
+
+# Pfad zur Test-Suite für /test (einmalig beim Start aufgelöst)
+TEST_SCRIPT_PATH = os.path.join(os.getcwd(), "Test", "test.py")
+
+# Gebündeltes Speichern: Änderungen werden nach SAVE_DELAY Sekunden gemeinsam geschrieben
+SAVE_DELAY = 0.5
+_save_dirty = False
+_save_task = None
+
+def flush_save():
+    """Schreibt ausstehende Änderungen sofort auf die Festplatte"""
+    global _save_dirty
+    if not _save_dirty:
+        return
+    _save_dirty = False
+    save_data(event_data, channel_id, user_team_assignments)
+
+async def _delayed_flush():
+    """Wartet SAVE_DELAY Sekunden und speichert dann alle bis dahin angefallenen Änderungen"""
+    await asyncio.sleep(SAVE_DELAY)
+    flush_save()
+
+def schedule_save():
+    """
+    Markiert die Daten als geändert und plant ein gebündeltes Speichern.
+    Mehrere Aufrufe innerhalb von SAVE_DELAY Sekunden führen zu nur einem Schreibvorgang.
+    """
+    global _save_dirty, _save_task
+    _save_dirty = True
+    # Format-Flags sofort aktualisieren, nicht erst beim Schreiben
+    refresh_event_metadata(event_data.get('event'))
+    
+    if _save_task is None or _save_task.done():
+        try:
+            _save_task = asyncio.get_running_loop().create_task(_delayed_flush())
+        except RuntimeError:
+            # Keine laufende Event-Loop: direkt speichern
+            flush_save()
+
+atexit.register(flush_save)
+
+# Laufende Hintergrund-Tasks (starke Referenzen, damit sie nicht vorzeitig vom GC entfernt werden)
+_bg_tasks = set()
+
+def run_in_background(coro):
+    """
+    Startet eine Coroutine als Hintergrund-Task, ohne auf sie zu warten
+    (z.B. für Log-Nachrichten, die die Antwort an den Benutzer nicht verzögern sollen)
+    
+    Parameters:
+    - coro: Die auszuführende Coroutine
+    
+    Returns:
+    - Der erstellte Task
+    """
+    task = asyncio.create_task(coro)
+    _bg_tasks.add(task)
+    task.add_done_callback(_bg_tasks.discard)
+    return task
+
+async def _safe_delete(message):
+    """Löscht eine Nachricht; Fehler (z.B. bereits gelöscht, fehlende Rechte) werden nur protokolliert"""
+    try:
+        await message.delete()
+    except discord.HTTPException as e:
+        logger.debug("Nachricht %s konnte nicht gelöscht werden: %s", message.id, e)
+
+# Zwischengespeicherter Event-Channel (wird bei /set_channel und on_ready neu gesetzt)
+_cached_channel = None
+
 # Helper functions
+def get_event_channel():
+    """Liefert den Event-Channel; löst ihn nur neu auf, wenn sich channel_id geändert hat"""
+    global _cached_channel
+    if not channel_id:
+        return None
+    if _cached_channel is None or _cached_channel.id != channel_id:
+        _cached_channel = bot.get_channel(channel_id)
+    return _cached_channel
+
 def get_event():
     """Get the current event data"""
     # Defensive Programmierung: Stelle sicher, dass event_data existiert und ein Dictionary ist
@@ -89,7 +187,24 @@ def get_event():
 
 def get_user_team(user_id):
     """Get the team name for a user"""
-    return user_team_assignments.get(str(user_id))
+    entry = user_team_assignments.get(int(user_id))
+    return entry[0] if entry else None
+
+def assign_user_team(user_id, team_name):
+    """Weist einen Benutzer einem Team zu (gespeichert als (Teamname, Teamname in Kleinbuchstaben))"""
+    user_team_assignments[int(user_id)] = (team_name, team_name.lower())
+    invalidate_perms_cache(user_id)
+
+def unassign_user(user_id):
+    """
+    Entfernt die Team-Zuweisung eines Benutzers
+    
+    Returns:
+    - Der bisherige Teamname oder None
+    """
+    entry = user_team_assignments.pop(int(user_id), None)
+    invalidate_perms_cache(user_id)
+    return entry[0] if entry else None
 
 def get_team_total_size(event, team_name):
     """
@@ -115,9 +230,7 @@ def get_team_total_size(event, team_name):
     team_id = None
     
     # Prüfe, ob das Team-Dictionary jetzt das erweiterte Format mit IDs verwendet
-    using_team_ids = False
-    if event["teams"] and isinstance(next(iter(event["teams"].values())), dict):
-        using_team_ids = True
+    using_team_ids = event.get("schema", SCHEMA_LEGACY) >= SCHEMA_V2
     
     if using_team_ids:
         # Neues Format mit Team-IDs
@@ -135,29 +248,15 @@ def get_team_total_size(event, team_name):
                 registered_name = name
                 break
     
-    # Suche alle Einträge des Teams auf der Warteliste
+    # Suche alle Einträge des Teams auf der Warteliste über den Index
+    waitlist = event["waitlist"]
     waitlist_entries = []
     waitlist_size = 0
     
-    # Prüfe, ob die Warteliste das erweiterte Format mit IDs verwendet
-    using_waitlist_ids = False
-    if event["waitlist"] and len(event["waitlist"][0]) > 2:
-        using_waitlist_ids = True
-    
-    if using_waitlist_ids:
-        # Neues Format mit Team-IDs
-        for i, entry in enumerate(event["waitlist"]):
-            if len(entry) >= 3:  # Format: (team_name, size, team_id)
-                wl_team, wl_size, wl_team_id = entry[0], entry[1], entry[2]
-                if wl_team.lower() == team_name:
-                    waitlist_entries.append((i, wl_team, wl_size, wl_team_id))
-                    waitlist_size += wl_size
-    else:
-        # Altes Format (abwärtskompatibel)
-        for i, (wl_team, wl_size) in enumerate(event["waitlist"]):
-            if wl_team.lower() == team_name:
-                waitlist_entries.append((i, wl_team, wl_size, None))
-                waitlist_size += wl_size
+    for i in get_waitlist_index(event).get(team_name, ()):
+        entry = waitlist[i]
+        waitlist_entries.append((i, entry["team_name"], entry["size"], entry["team_id"]))
+        waitlist_size += entry["size"]
     
     # Gesamtgröße
     total_size = event_size + waitlist_size
@@ -168,6 +267,95 @@ def get_team_total_size(event, team_name):
 # NEUE HILFSFUNKTIONEN ######### #
 # ############################# #
 
+# Berechtigungen eines Benutzers für eine einzelne Interaktion
+Permissions = namedtuple("Permissions", ["is_admin", "is_clan_rep", "team_name", "has_team"])
+
+# Zwischenspeicher für get_perms, Schlüssel: (interaction.id, user.id)
+PERMS_CACHE_SIZE = 256
+_perms_cache = OrderedDict()
+
+def invalidate_perms_cache(user_id=None):
+    """
+    Verwirft zwischengespeicherte Berechtigungen und Team-Zuweisungen
+    
+    Parameters:
+    - user_id: Nur Einträge dieses Benutzers verwerfen (None = alle)
+    """
+    if user_id is None:
+        _perms_cache.clear()
+        return
+    
+    user_id = int(user_id)
+    for key in [key for key in _perms_cache if key[1] == user_id]:
+        del _perms_cache[key]
+
+def get_perms(interaction):
+    """
+    Ermittelt Rollen und Team-Zuweisung des Benutzers einer Interaktion.
+    Die Rollen werden nur einmal durchlaufen, das Ergebnis wird pro Interaktion zwischengespeichert.
+    
+    Parameters:
+    - interaction: Discord-Interaktion
+    
+    Returns:
+    - Permissions-Tupel (is_admin, is_clan_rep, team_name, has_team)
+    """
+    user = interaction.user
+    key = (interaction.id, user.id)
+    perms = _perms_cache.get(key)
+    if perms is not None:
+        _perms_cache.move_to_end(key)
+        return perms
+    
+    if str(user.id) in ADMIN_IDS:
+        is_admin = is_clan_rep = True
+    else:
+        role_names = frozenset(role.name for role in getattr(user, "roles", ()))
+        is_admin = ORGANIZER_ROLE in role_names
+        is_clan_rep = CLAN_REP_ROLE in role_names
+    
+    team_name = get_user_team(user.id)
+    perms = Permissions(is_admin, is_clan_rep, team_name, team_name is not None)
+    
+    _perms_cache[key] = perms
+    if len(_perms_cache) > PERMS_CACHE_SIZE:
+        _perms_cache.popitem(last=False)
+    
+    return perms
+
+# Zwischenspeicher für abgerufene Discord-Benutzer, Schlüssel: user.id, Wert: (User, Zeitstempel)
+USER_CACHE_TTL = 600
+USER_CACHE_SIZE = 512
+_user_cache = OrderedDict()
+
+async def get_user_cached(user_id):
+    """
+    Liefert einen Discord-Benutzer, bevorzugt aus dem lokalen Cache
+    
+    Parameters:
+    - user_id: Discord-ID des Benutzers
+    
+    Returns:
+    - discord.User (wirft die Ausnahmen von fetch_user, falls der Abruf fehlschlägt)
+    """
+    user_id = int(user_id)
+    user = bot.get_user(user_id)
+    if user:
+        return user
+    
+    now = time.monotonic()
+    cached = _user_cache.get(user_id)
+    if cached and now - cached[1] < USER_CACHE_TTL:
+        _user_cache.move_to_end(user_id)
+        return cached[0]
+    
+    user = await bot.fetch_user(user_id)
+    _user_cache[user_id] = (user, now)
+    _user_cache.move_to_end(user_id)
+    if len(_user_cache) > USER_CACHE_SIZE:
+        _user_cache.popitem(last=False)
+    return user
+
 async def validate_command_context(interaction, required_role=None, check_event=True, team_required=False):
     """
     Validiert den Kontext eines Befehls: Event, Rolle, Team-Zugehörigkeit
@@ -190,8 +378,17 @@ async def validate_command_context(interaction, required_role=None, check_event=
     else:
         event = None
 
+    perms = get_perms(interaction)
+
     # Rollenprüfung
-    if required_role and not has_role(interaction.user, required_role):
+    if required_role == ORGANIZER_ROLE:
+        has_required_role = perms.is_admin
+    elif required_role == CLAN_REP_ROLE:
+        has_required_role = perms.is_clan_rep
+    else:
+        has_required_role = not required_role or has_role(interaction.user, required_role)
+    
+    if not has_required_role:
         await interaction.response.send_message(
             f"Nur Mitglieder mit der Rolle '{required_role}' können diese Aktion ausführen.",
             ephemeral=True
@@ -199,8 +396,7 @@ async def validate_command_context(interaction, required_role=None, check_event=
         return None, None
 
     # Team-Zugehörigkeit prüfen
-    user_id = str(interaction.user.id)
-    team_name = user_team_assignments.get(user_id)
+    team_name = perms.team_name
     
     if team_required and not team_name:
         await interaction.response.send_message(
@@ -211,6 +407,50 @@ async def validate_command_context(interaction, required_role=None, check_event=
         
     return event, team_name
 
+class MissingOrganizerRole(app_commands.CheckFailure):
+    """Wird ausgelöst, wenn ein Befehl die Orga-Rolle erfordert, die dem Benutzer fehlt"""
+    pass
+
+def organizer_only():
+    """
+    Check-Decorator für Slash-Commands, die nur das Orga-Team ausführen darf.
+    discord.py prüft die Rolle vor dem Aufruf des Befehls; die Rückmeldung an den
+    Benutzer erfolgt zentral in on_app_command_error.
+    """
+    async def predicate(interaction):
+        if has_role(interaction.user, ORGANIZER_ROLE):
+            return True
+        raise MissingOrganizerRole()
+    return app_commands.check(predicate)
+
+# Maximale Länge der Fehlerdetails in der Rückmeldung an das Orga-Team
+ERROR_DETAILS_LIMIT = 1500
+
+@bot.tree.error
+async def on_app_command_error(interaction, error):
+    """Zentrale Fehlerbehandlung für Slash-Commands"""
+    if isinstance(error, MissingOrganizerRole):
+        command_name = interaction.command.name if interaction.command else "?"
+        logger.warning("Berechtigungsfehler: %s (%s) hat versucht, /%s ohne ausreichende Berechtigungen zu verwenden", interaction.user.name, interaction.user.id, command_name)
+        await send_feedback(
+            interaction,
+            f"Nur Mitglieder mit der Rolle '{ORGANIZER_ROLE}' können diese Aktion ausführen.",
+            ephemeral=True
+        )
+        return
+    
+    # Unerwartete Fehler aus dem Befehl selbst (z.B. nicht abgefangene Ausnahmen)
+    original = getattr(error, "original", error)
+    command_name = interaction.command.name if interaction.command else "?"
+    logger.error("Fehler im Slash-Command /%s: %s", command_name, original, exc_info=original)
+    
+    # Fehlerdetails nur dem Orga-Team zeigen (gekürzt wegen des Discord-Zeichenlimits)
+    message = f"❌ Bei der Ausführung von /{command_name} ist ein Fehler aufgetreten."
+    if has_role(interaction.user, ORGANIZER_ROLE):
+        details = f"{type(original).__name__}: {original}"[:ERROR_DETAILS_LIMIT]
+        message += f"\n```{details}```"
+    await send_feedback(interaction, message, ephemeral=True)
+
 async def validate_team_size(interaction, team_size, max_team_size, allow_zero=True):
     """
     Validiert die Teamgröße gegen die maximale Teamgröße
@@ -333,9 +573,8 @@ async def handle_team_unregistration(interaction, team_name, is_admin=False):
     waitlist_indices = []
     
     # Verwende Hilfsfunktion zur Formaterkennung
-    from utils import is_using_team_ids, is_using_waitlist_ids
+    from utils import is_using_team_ids
     using_team_ids = is_using_team_ids(event)
-    using_waitlist_ids = is_using_waitlist_ids(event)
     
     if using_team_ids:
         # Neues Format mit Team-IDs
@@ -351,17 +590,10 @@ async def handle_team_unregistration(interaction, team_name, is_admin=False):
                 break
     
     # Suche alle Einträge des Teams auf der Warteliste
-    if using_waitlist_ids:
-        for i, entry in enumerate(event["waitlist"]):
-            if len(entry) >= 3:  # Format: (team_name, size, team_id)
-                if entry[0].lower() == team_name:
-                    team_on_waitlist = True
-                    waitlist_indices.append(i)
-    else:
-        for i, (wl_team, _) in enumerate(event["waitlist"]):
-            if wl_team.lower() == team_name:
-                team_on_waitlist = True
-                waitlist_indices.append(i)
+    for i, entry in enumerate(event["waitlist"]):
+        if entry["team_name"].lower() == team_name:
+            team_on_waitlist = True
+            waitlist_indices.append(i)
     
     if not team_registered and not team_on_waitlist:
         await send_feedback(
@@ -413,7 +645,7 @@ async def handle_team_size_change(interaction, team_name, old_size, new_size, is
         logger.warning(f"Team-Größenänderung für '{team_name}' fehlgeschlagen: Kein aktives Event")
         return "Es gibt derzeit kein aktives Event."
         
-    user_id = str(interaction.user.id)
+    user_id = interaction.user.id
     size_difference = new_size - old_size
     
     # Loggen der Anfrage zur Team-Größenänderung
@@ -422,7 +654,7 @@ async def handle_team_size_change(interaction, team_name, old_size, new_size, is
     
     # Keine Änderung
     if size_difference == 0:
-        logger.debug(f"Team-Größenänderung für '{team_name}' übersprungen: Keine Änderung (Größe bleibt {new_size})")
+        logger.debug("Team-Größenänderung für '%s' übersprungen: Keine Änderung (Größe bleibt %s)", team_name, new_size)
         return f"Team {team_name} ist bereits mit {new_size} Personen angemeldet."
     
     # Abmeldung (size == 0)
@@ -478,12 +710,13 @@ async def handle_team_size_change(interaction, team_name, old_size, new_size, is
                 using_waitlist_ids = is_using_waitlist_ids(event)
                 
                 if using_waitlist_ids:
-                    event["waitlist"].append((team_name, waitlist_size, team_id))
+                    event["waitlist"].append(make_waitlist_entry(team_name, waitlist_size, team_id))
                 else:
-                    event["waitlist"].append((team_name, waitlist_size))
+                    event["waitlist"].append(make_waitlist_entry(team_name, waitlist_size))
+                mark_waitlist_changed(event)
                 
                 # Nutzer diesem Team zuweisen
-                user_team_assignments[user_id] = team_name
+                assign_user_team(user_id, team_name)
                 
                 # Speichere für Benachrichtigungen
                 team_requester[team_name] = interaction.user
@@ -502,12 +735,13 @@ async def handle_team_size_change(interaction, team_name, old_size, new_size, is
                 using_waitlist_ids = is_using_waitlist_ids(event)
                 
                 if using_waitlist_ids:
-                    event["waitlist"].append((team_name, new_size, team_id))
+                    event["waitlist"].append(make_waitlist_entry(team_name, new_size, team_id))
                 else:
-                    event["waitlist"].append((team_name, new_size))
+                    event["waitlist"].append(make_waitlist_entry(team_name, new_size))
+                mark_waitlist_changed(event)
                 
                 # Nutzer diesem Team zuweisen
-                user_team_assignments[user_id] = team_name
+                assign_user_team(user_id, team_name)
                 
                 # Speichere für Benachrichtigungen
                 team_requester[team_name] = interaction.user
@@ -550,7 +784,7 @@ async def handle_team_size_change(interaction, team_name, old_size, new_size, is
                     event["teams"][team_name] = new_size
             
             # Assign user to this team
-            user_team_assignments[user_id] = team_name
+            assign_user_team(user_id, team_name)
             
             # Log für Team-Anmeldung
             action_by = "Admin " if is_admin else ""
@@ -604,7 +838,7 @@ async def update_event_displays(interaction=None, channel=None):
     try:
         if not channel and interaction:
             if channel_id:
-                channel = bot.get_channel(channel_id)
+                channel = get_event_channel()
             else:
                 channel = bot.get_channel(interaction.channel_id)
         
@@ -625,7 +859,7 @@ async def process_waitlist_after_change(interaction, free_slots):
     - free_slots: Anzahl der frei gewordenen Slots
     """
     if free_slots <= 0:
-        logger.debug(f"Keine freien Slots verfügbar für Wartelisten-Verarbeitung (free_slots={free_slots})")
+        logger.debug("Keine freien Slots verfügbar für Wartelisten-Verarbeitung (free_slots=%s)", free_slots)
         return
     
     event = get_event()
@@ -642,25 +876,15 @@ async def process_waitlist_after_change(interaction, free_slots):
     # Solange freie Plätze vorhanden sind und die Warteliste nicht leer ist
     while free_slots > 0 and event["waitlist"]:
         # Nehme den ersten Eintrag von der Warteliste
-        # Prüfe, ob die Warteliste das erweiterte Format mit IDs verwendet
-        using_waitlist_ids = False
-        if event["waitlist"] and len(event["waitlist"][0]) > 2:
-            using_waitlist_ids = True
-        
-        if using_waitlist_ids:
-            # Neues Format mit Team-IDs
-            entry = event["waitlist"][0]
-            wait_team_name, wait_size, wait_team_id = entry
-        else:
-            # Altes Format
-            wait_team_name, wait_size = event["waitlist"][0]
-            wait_team_id = None
+        entry = event["waitlist"][0]
+        wait_team_name, wait_size, wait_team_id = entry["team_name"], entry["size"], entry["team_id"]
         
         # Prüfe, ob das gesamte Team Platz hat
         if wait_size <= free_slots:
             # Das ganze Team kann nachrücken
             # Entferne Team von der Warteliste
             event["waitlist"].pop(0)
+            mark_waitlist_changed(event)
             
             # Füge Team zum Event hinzu
             event["slots_used"] += wait_size
@@ -718,10 +942,8 @@ async def process_waitlist_after_change(interaction, free_slots):
         else:
             # Das Team kann nur teilweise nachrücken
             # Aktualisiere die Größe auf der Warteliste
-            if using_waitlist_ids:
-                event["waitlist"][0] = (wait_team_name, wait_size - free_slots, wait_team_id)
-            else:
-                event["waitlist"][0] = (wait_team_name, wait_size - free_slots)
+            event["waitlist"][0] = make_waitlist_entry(wait_team_name, wait_size - free_slots, wait_team_id)
+            mark_waitlist_changed(event)
             
             # Prüfe, ob das Team bereits im Event ist
             team_in_event = False
@@ -907,9 +1129,9 @@ async def admin_add_team(interaction, team_name, size, discord_user_id=None, dis
     
     # Wenn ein Discord-Nutzer angegeben wurde, prüfe, ob dieser bereits einem Team zugewiesen ist
     if discord_user_id:
-        user_id = str(discord_user_id)
+        user_id = int(discord_user_id)
         if user_id in user_team_assignments:
-            assigned_team = user_team_assignments[user_id]
+            assigned_team = user_team_assignments[user_id][0]
             await send_feedback(
                 interaction,
                 f"Der Nutzer ist bereits dem Team '{assigned_team}' zugewiesen.",
@@ -941,8 +1163,7 @@ async def admin_add_team(interaction, team_name, size, discord_user_id=None, dis
         
         # Wenn ein Discord-Nutzer angegeben wurde, weise ihn diesem Team zu
         if discord_user_id:
-            user_id = str(discord_user_id)
-            user_team_assignments[user_id] = team_name
+            assign_user_team(discord_user_id, team_name)
         
         # Log eintragen
         admin_action = f"Admin {interaction.user.name} hat"
@@ -968,19 +1189,16 @@ async def admin_add_team(interaction, team_name, size, discord_user_id=None, dis
         team_id = generate_team_id(team_name)
         
         # Prüfe, ob die Warteliste das erweiterte Format mit IDs verwendet
-        using_waitlist_ids = False
-        if event["waitlist"] and len(event["waitlist"][0]) > 2:
-            using_waitlist_ids = True
-        
-        if using_waitlist_ids:
-            event["waitlist"].append((team_name, size, team_id))
+        from utils import is_using_waitlist_ids
+        if is_using_waitlist_ids(event):
+            event["waitlist"].append(make_waitlist_entry(team_name, size, team_id))
         else:
-            event["waitlist"].append((team_name, size))
+            event["waitlist"].append(make_waitlist_entry(team_name, size))
+        mark_waitlist_changed(event)
         
         # Wenn ein Discord-Nutzer angegeben wurde, weise ihn diesem Team zu
         if discord_user_id:
-            user_id = str(discord_user_id)
-            user_team_assignments[user_id] = team_name
+            assign_user_team(discord_user_id, team_name)
         
         # Log eintragen
         admin_action = f"Admin {interaction.user.name} hat"
@@ -1035,7 +1253,7 @@ class TeamRegistrationModal(ui.Modal):
     
     async def on_submit(self, interaction: discord.Interaction):
         # Definiere user_id aus der Interaktion
-        user_id = str(interaction.user.id)
+        user_id = interaction.user.id
         
         # Verarbeite die Teamregistrierungslogik
         team_name = self.team_name.value.strip()  # Behalte Originalschreibweise
@@ -1059,8 +1277,8 @@ class TeamRegistrationModal(ui.Modal):
             return
         
         # Prüfe, ob der Nutzer bereits einem anderen Team zugewiesen ist (case-insensitive)
-        if user_id in user_team_assignments and user_team_assignments[user_id].lower() != team_name.lower():
-            assigned_team_name = user_team_assignments[user_id]
+        if user_id in user_team_assignments and user_team_assignments[user_id][1] != team_name.lower():
+            assigned_team_name = user_team_assignments[user_id][0]
             await interaction.response.send_message(
                 f"Du bist bereits dem Team '{assigned_team_name}' zugewiesen. Du kannst nur für ein Team anmelden.",
                 ephemeral=True
@@ -1202,8 +1420,8 @@ class AdminTeamCreateModal(ui.Modal):
             try:
                 # Versuche als ID zu interpretieren
                 if discord_user_input.isdigit():
-                    user = await bot.fetch_user(int(discord_user_input))
-                    discord_user_id = str(user.id)
+                    user = await get_user_cached(discord_user_input)
+                    discord_user_id = user.id
                     discord_username = user.display_name
                 else:
                     # Versuche Benutzer anhand des Namens zu finden
@@ -1215,7 +1433,7 @@ class AdminTeamCreateModal(ui.Modal):
                         
                         if found_members:
                             user = found_members[0]
-                            discord_user_id = str(user.id)
+                            discord_user_id = user.id
                             discord_username = user.display_name
                         else:
                             await interaction.response.send_message(
@@ -1265,10 +1483,10 @@ class BaseView(ui.View):
                     )
                 except discord.errors.NotFound:
                     # Nachricht existiert nicht mehr, ignorieren
-                    logger.debug(f"Timeout-Nachricht konnte nicht editiert werden: Nachricht nicht gefunden")
+                    logger.debug("Timeout-Nachricht konnte nicht editiert werden: Nachricht nicht gefunden")
                 except discord.errors.Forbidden:
                     # Keine Berechtigung, ignorieren
-                    logger.debug(f"Timeout-Nachricht konnte nicht editiert werden: Keine Berechtigung")
+                    logger.debug("Timeout-Nachricht konnte nicht editiert werden: Keine Berechtigung")
         except Exception as e:
             # Allgemeine Fehlerbehandlung als Fallback
             logger.warning(f"Fehler beim Timeout-Handling: {e}")
@@ -1366,7 +1584,8 @@ class AdminTeamSelector(BaseView):
             )
         
         # Liste der Teams auf der Warteliste
-        for i, (team_name, size) in enumerate(event["waitlist"]):
+        for i, entry in enumerate(event["waitlist"]):
+            team_name, size = entry["team_name"], entry["size"]
             team_options.append(
                 discord.SelectOption(
                     label=f"{team_name} ({size} Personen)",
@@ -1427,7 +1646,8 @@ class AdminTeamSelector(BaseView):
             team_found = False
             team_size = 0
             position = 0
-            for i, (wl_team, wl_size) in enumerate(event["waitlist"]):
+            for i, entry in enumerate(event["waitlist"]):
+                wl_team, wl_size = entry["team_name"], entry["size"]
                 if wl_team == team_name:
                     team_found = True
                     team_size = wl_size
@@ -1461,85 +1681,66 @@ class AdminTeamSelector(BaseView):
 
 class EventActionView(BaseView):
     """View mit Buttons für Event-Aktionen"""
+    
+    # Statische Button-Definitionen; pro View werden daraus nur noch die Buttons erzeugt
+    REGISTER_BUTTON = dict(label="Team anmelden", emoji="✅", style=discord.ButtonStyle.success, custom_id="event_register")
+    UNREGISTER_BUTTON = dict(label="Team abmelden", emoji="❌", style=discord.ButtonStyle.danger, custom_id="event_unregister")
+    TEAM_INFO_BUTTON = dict(label="Mein Team", emoji="👥", style=discord.ButtonStyle.primary, custom_id="event_teaminfo")
+    EDIT_BUTTON = dict(label="Team bearbeiten", emoji="✏️", style=discord.ButtonStyle.primary, custom_id="event_edit_team")
+    UNREGISTER_TEAM_BUTTON = dict(label="Team abmelden", emoji="❌", style=discord.ButtonStyle.danger, custom_id="event_unregister_team")
+    ADMIN_BUTTON = dict(label="Admin", emoji="⚙️", style=discord.ButtonStyle.danger, custom_id="event_admin")
+    
     def __init__(self, event, user_has_admin=False, user_has_clan_rep=False, has_team=False, team_name=None):
         super().__init__(timeout=3600, title="Event-Aktionen")  # 1 Stunde Timeout
+        self.event = event
+        self.has_admin = user_has_admin
+        self.has_clan_rep = user_has_clan_rep
+        self.has_team = has_team
         self.team_name = team_name
         
         # Team anmelden Button (nur für Clan-Rep)
-        register_button = ui.Button(
-            label="Team anmelden",
-            emoji="✅",
-            style=discord.ButtonStyle.success,
-            custom_id=f"event_register",
-            disabled=not user_has_clan_rep or has_team
-        )
+        register_button = ui.Button(**self.REGISTER_BUTTON, disabled=not user_has_clan_rep or has_team)
         register_button.callback = self.register_callback
         self.add_item(register_button)
         
         # Team abmelden Button (nur für Clan-Rep mit Team)
         if has_team and team_name:
-            unregister_button = ui.Button(
-                label="Team abmelden",
-                emoji="❌",
-                style=discord.ButtonStyle.danger,
-                custom_id=f"event_unregister",
-                disabled=not user_has_clan_rep
-            )
+            unregister_button = ui.Button(**self.UNREGISTER_BUTTON, disabled=not user_has_clan_rep)
             unregister_button.callback = self.unregister_callback
             self.add_item(unregister_button)
         
         # Warteliste wird automatisch verwaltet, daher kein Button mehr erforderlich
         
         # Team-Info für alle sichtbar
-        team_info_button = ui.Button(
-            label="Mein Team", 
-            emoji="👥",
-            style=discord.ButtonStyle.primary,
-            custom_id=f"event_teaminfo"
-        )
+        team_info_button = ui.Button(**self.TEAM_INFO_BUTTON)
         team_info_button.callback = self.team_info_callback
         self.add_item(team_info_button)
         
         # Team bearbeiten Button (für Clan-Rep mit Team und Admins)
         if (user_has_clan_rep and has_team) or user_has_admin:
-            edit_button = ui.Button(
-                label="Team bearbeiten", 
-                emoji="✏️",
-                style=discord.ButtonStyle.primary,
-                custom_id=f"event_edit_team"
-            )
+            edit_button = ui.Button(**self.EDIT_BUTTON)
             edit_button.callback = self.edit_team_callback
             self.add_item(edit_button)
             
             # Team abmelden Button (für Clan-Rep mit Team)
             if user_has_clan_rep and has_team:
-                unregister_button = ui.Button(
-                    label="Team abmelden", 
-                    emoji="❌",
-                    style=discord.ButtonStyle.danger,
-                    custom_id=f"event_unregister_team"
-                )
+                unregister_button = ui.Button(**self.UNREGISTER_TEAM_BUTTON)
                 unregister_button.callback = self.unregister_callback
                 self.add_item(unregister_button)
         
         # Admin-Aktionen (nur für Admins)
         if user_has_admin:
-            admin_button = ui.Button(
-                label="Admin", 
-                emoji="⚙️",
-                style=discord.ButtonStyle.danger,
-                custom_id=f"event_admin"
-            )
+            admin_button = ui.Button(**self.ADMIN_BUTTON)
             admin_button.callback = self.admin_callback
             self.add_item(admin_button)
     
     async def register_callback(self, interaction: discord.Interaction):
         """Callback für Team-Registrierung-Button"""
-        user_id = str(interaction.user.id)
+        user_id = interaction.user.id
         
         # Prüfe, ob der Benutzer bereits einem Team zugewiesen ist
         if user_id in user_team_assignments:
-            team_name = user_team_assignments[user_id]
+            team_name = user_team_assignments[user_id][0]
             await interaction.response.send_message(
                 f"Du bist bereits dem Team '{team_name}' zugewiesen. Du kannst nicht erneut registrieren.",
                 ephemeral=True
@@ -1580,7 +1781,7 @@ class EventActionView(BaseView):
     
     async def unregister_callback(self, interaction: discord.Interaction):
         """Callback für Team-Abmeldung-Button"""
-        user_id = str(interaction.user.id)
+        user_id = interaction.user.id
         
         # Überprüfe Berechtigung mit der verbesserten has_role-Funktion
         if not has_role(interaction.user, CLAN_REP_ROLE):
@@ -1596,7 +1797,7 @@ class EventActionView(BaseView):
             )
             return
         
-        team_name = user_team_assignments.get(user_id)
+        team_name = get_user_team(user_id)
         
         if not team_name:
             await interaction.response.send_message(
@@ -1625,7 +1826,8 @@ class EventActionView(BaseView):
         team_registered = team_name in event["teams"]
         team_on_waitlist = False
         
-        for i, (wl_team, _) in enumerate(event["waitlist"]):
+        for i, entry in enumerate(event["waitlist"]):
+            wl_team = entry["team_name"]
             if wl_team == team_name:
                 team_on_waitlist = True
                 break
@@ -1671,10 +1873,10 @@ class EventActionView(BaseView):
         
         global user_team_assignments
         event = get_event()
-        user_id = str(interaction.user.id)
+        user_id = interaction.user.id
         
         # Hole das Team des Users
-        team_name = user_team_assignments.get(user_id)
+        team_name = get_user_team(user_id)
         team_size = None
         if team_name and event and team_name in event["teams"]:
             team_size = event["teams"][team_name]
@@ -1718,7 +1920,7 @@ class EventActionView(BaseView):
     
     async def edit_team_callback(self, interaction: discord.Interaction):
         """Callback für Team-Bearbeiten-Button"""
-        user_id = str(interaction.user.id)
+        user_id = interaction.user.id
         
         # Verbesserte Rollenprüfung mit has_role (berücksichtigt ADMIN_IDs in DMs)
         is_admin = has_role(interaction.user, ORGANIZER_ROLE)
@@ -1768,7 +1970,7 @@ class EventActionView(BaseView):
             )
         elif is_clan_rep:
             # Clan-Reps können ihr eigenes Team bearbeiten oder ein neues Team anmelden
-            team_name = user_team_assignments.get(user_id)
+            team_name = get_user_team(user_id)
             
             if not team_name:
                 # Wenn kein Team zugewiesen ist, öffne das Formular für die Teamerstellung
@@ -1790,7 +1992,8 @@ class EventActionView(BaseView):
             if team_name in event["teams"]:
                 team_size = event["teams"][team_name]
             else:
-                for wl_team, wl_size in event["waitlist"]:
+                for entry in event["waitlist"]:
+                    wl_team, wl_size = entry["team_name"], entry["size"]
                     if wl_team == team_name:
                         team_size = wl_size
                         is_on_waitlist = True
@@ -2039,7 +2242,8 @@ class AdminActionView(BaseView):
         # Warteliste
         if event["waitlist"]:
             waitlist_text = ""
-            for i, (team_name, size) in enumerate(event["waitlist"]):
+            for i, entry in enumerate(event["waitlist"]):
+                team_name, size = entry["team_name"], entry["size"]
                 waitlist_text += f"{i+1}. **{team_name}**: {size} {'Person' if size == 1 else 'Personen'}\n"
             
             embed.add_field(
@@ -2360,6 +2564,7 @@ class DeleteConfirmationView(BaseConfirmationView):
                 # Jetzt löschen
                 event_data.clear()
                 user_team_assignments.clear()
+                invalidate_perms_cache()
                 save_data(event_data, channel_id, user_team_assignments)
                 
                 embed = discord.Embed(
@@ -2451,15 +2656,15 @@ async def send_team_dm_notification(team_name, message):
     # Suche nach dem Benutzer, der das Team erstellt hat (case-insensitive)
     team_name_lower = team_name.lower() if team_name else ""
     team_leader_id = None
-    for uid, tname in user_team_assignments.items():
-        if tname.lower() == team_name_lower:
+    for uid, (_, tname_lower) in user_team_assignments.items():
+        if tname_lower == team_name_lower:
             team_leader_id = uid
             break
     
     if team_leader_id:
         try:
             # Versuche, den Benutzer zu erreichen
-            user = await bot.fetch_user(int(team_leader_id))
+            user = await get_user_cached(team_leader_id)
             if user:
                 await user.send(message)
                 logger.info(f"DM Benachrichtigung an {user.name} für Team {team_name} gesendet")
@@ -2513,7 +2718,7 @@ async def update_team_size(interaction, team_name, new_size, is_admin=False, rea
         )
         return False
     
-    user_id = str(interaction.user.id)
+    user_id = interaction.user.id
     
     # Prüfe Berechtigungen für Nicht-Admins
     if not is_admin:
@@ -2527,7 +2732,8 @@ async def update_team_size(interaction, team_name, new_size, is_admin=False, rea
             return False
             
         # Prüfe, ob der Nutzer bereits einem Team zugewiesen ist
-        user_team = user_team_assignments.get(user_id, "").lower()
+        assignment = user_team_assignments.get(user_id)
+        user_team = assignment[1] if assignment else ""
         if user_team and user_team != team_name:
             await interaction.response.send_message(
                 "Du kannst nur dein eigenes Team bearbeiten.",
@@ -2568,8 +2774,7 @@ async def update_team_size(interaction, team_name, new_size, is_admin=False, rea
     if current_total_size == 0 and new_size > 0:
         # Neues Team anlegen
         # Weise den aktuellen Benutzer dem Team zu
-        user_id = str(interaction.user.id)
-        user_team_assignments[user_id] = team_name
+        assign_user_team(interaction.user.id, team_name)
         
         # Füge das Team zum Event oder zur Warteliste hinzu (wird später erledigt)
         logger.info(f"Neues Team '{team_name}' wird mit Größe {new_size} erstellt")
@@ -2589,13 +2794,15 @@ async def update_team_size(interaction, team_name, new_size, is_admin=False, rea
         # Entferne von Warteliste (case-insensitive)
         if waitlist_size > 0:
             waitlist_indices_to_remove = []
-            for i, (wl_team, wl_size) in enumerate(event["waitlist"]):
+            for i, entry in enumerate(event["waitlist"]):
+                wl_team, wl_size = entry["team_name"], entry["size"]
                 if wl_team.lower() == team_name:
                     waitlist_indices_to_remove.append(i)
             
             # Von hinten nach vorne entfernen, um Indizes nicht zu verschieben
             for i in sorted(waitlist_indices_to_remove, reverse=True):
                 event["waitlist"].pop(i)
+            mark_waitlist_changed(event)
         
         # Statustext für Nachricht erstellen
         total_size_message = ""
@@ -2608,12 +2815,12 @@ async def update_team_size(interaction, team_name, new_size, is_admin=False, rea
         
         # Finde alle Benutzer, die diesem Team zugewiesen sind, und entferne sie (case-insensitive)
         users_to_remove = []
-        for uid, tname in user_team_assignments.items():
-            if tname.lower() == team_name:
+        for uid, (_, tname_lower) in user_team_assignments.items():
+            if tname_lower == team_name:
                 users_to_remove.append(uid)
         
         for uid in users_to_remove:
-            del user_team_assignments[uid]
+            unassign_user(uid)
             
         save_data(event_data, channel_id, user_team_assignments)
         
@@ -2696,7 +2903,8 @@ async def update_team_size(interaction, team_name, new_size, is_admin=False, rea
         # Finde den richtigen Teamnamen in der Warteliste
         waitlist_team_name = None
         waitlist_index = -1
-        for i, (wl_team, wl_size) in enumerate(event["waitlist"]):
+        for i, entry in enumerate(event["waitlist"]):
+            wl_team, wl_size = entry["team_name"], entry["size"]
             if wl_team.lower() == team_name:
                 waitlist_team_name = wl_team
                 waitlist_index = i
@@ -2759,12 +2967,15 @@ async def update_team_size(interaction, team_name, new_size, is_admin=False, rea
             if waitlist_team_name:
                 # Team bereits auf Warteliste - erhöhe die Größe
                 new_waitlist_size = waitlist_size + waitlist_addition
-                event["waitlist"][waitlist_index] = (waitlist_team_name, new_waitlist_size)
+                event["waitlist"][waitlist_index] = make_waitlist_entry(
+                    waitlist_team_name, new_waitlist_size, event["waitlist"][waitlist_index]["team_id"]
+                )
                 waitlist_message = f"{waitlist_addition} Spieler wurden zur Warteliste hinzugefügt (jetzt {new_waitlist_size})."
             else:
                 # Team nicht auf Warteliste - füge es hinzu
-                event["waitlist"].append((team_name, waitlist_addition))
+                event["waitlist"].append(make_waitlist_entry(team_name, waitlist_addition))
                 waitlist_message = f"{waitlist_addition} Spieler wurden auf die Warteliste gesetzt (Position {len(event['waitlist'])})."
+            mark_waitlist_changed(event)
             
             # Log für Teamgröße-Erhöhung mit Warteliste
             admin_or_user = "Admin" if is_admin else "Benutzer"
@@ -2810,7 +3021,8 @@ async def update_team_size(interaction, team_name, new_size, is_admin=False, rea
         # Finde den richtigen Teamnamen in der Warteliste
         waitlist_team_name = None
         waitlist_index = -1
-        for i, (wl_team, wl_size) in enumerate(event["waitlist"]):
+        for i, entry in enumerate(event["waitlist"]):
+            wl_team, wl_size = entry["team_name"], entry["size"]
             if wl_team.lower() == team_name:
                 waitlist_team_name = wl_team
                 waitlist_index = i
@@ -2821,10 +3033,13 @@ async def update_team_size(interaction, team_name, new_size, is_admin=False, rea
             new_waitlist_size = waitlist_size - waitlist_reduction
             if new_waitlist_size > 0:
                 # Aktualisiere Warteliste
-                event["waitlist"][waitlist_index] = (waitlist_team_name, new_waitlist_size)
+                event["waitlist"][waitlist_index] = make_waitlist_entry(
+                    waitlist_team_name, new_waitlist_size, event["waitlist"][waitlist_index]["team_id"]
+                )
             else:
                 # Entferne von Warteliste
                 event["waitlist"].pop(waitlist_index)
+            mark_waitlist_changed(event)
         
         # Dann Event-Slots reduzieren, falls nötig
         if event_reduction > 0 and registered_team_name:
@@ -2910,11 +3125,13 @@ async def process_waitlist_after_change(interaction, free_slots):
     processed_teams = []
     
     while free_slots > 0 and event["waitlist"]:
-        team_name, size = event["waitlist"][0]
+        entry = event["waitlist"][0]
+        team_name, size = entry["team_name"], entry["size"]
         
         if size <= free_slots:
             # Das komplette Team kann nachrücken
             event["waitlist"].pop(0)
+            mark_waitlist_changed(event)
             event["slots_used"] += size
             event["teams"][team_name] = event["teams"].get(team_name, 0) + size
             free_slots -= size
@@ -2922,7 +3139,8 @@ async def process_waitlist_after_change(interaction, free_slots):
             processed_teams.append((team_name, size))
         elif free_slots > 0:
             # Nur ein Teil des Teams kann nachrücken
-            event["waitlist"][0] = (team_name, size - free_slots)
+            event["waitlist"][0] = make_waitlist_entry(team_name, size - free_slots, entry["team_id"])
+            mark_waitlist_changed(event)
             event["slots_used"] += free_slots
             event["teams"][team_name] = event["teams"].get(team_name, 0) + free_slots
             processed_teams.append((team_name, free_slots))
@@ -3011,7 +3229,8 @@ async def admin_add_team(interaction, team_name, size, discord_user_id=None, dis
         return False
     
     # Prüfe, ob Team bereits auf der Warteliste steht
-    for wl_team, _ in event["waitlist"]:
+    for entry in event["waitlist"]:
+        wl_team = entry["team_name"]
         if wl_team == team_name:
             await interaction.response.send_message(
                 f"Team {team_name} steht bereits auf der Warteliste. Verwende die Team-Bearbeitung, um die Größe zu ändern.",
@@ -3032,12 +3251,13 @@ async def admin_add_team(interaction, team_name, size, discord_user_id=None, dis
     # Bestimme, ob auf Warteliste oder direktes Hinzufügen
     if force_waitlist:
         # Direkt auf Warteliste setzen
-        event["waitlist"].append((team_name, size))
+        event["waitlist"].append(make_waitlist_entry(team_name, size))
+        mark_waitlist_changed(event)
         
         # Setze Benutzer-Team-Zuweisung, wenn angegeben
         if discord_user_id:
-            user_team_assignments[discord_user_id] = team_name
-            team_requester[team_name] = await bot.fetch_user(int(discord_user_id))
+            assign_user_team(discord_user_id, team_name)
+            team_requester[team_name] = await get_user_cached(discord_user_id)
         
         await interaction.response.send_message(
             f"Team {team_name} wurde mit {size} Personen auf die Warteliste gesetzt (Position {len(event['waitlist'])}).",
@@ -3062,7 +3282,7 @@ async def admin_add_team(interaction, team_name, size, discord_user_id=None, dis
             
             # Setze Benutzer-Team-Zuweisung, wenn angegeben
             if discord_user_id:
-                user_team_assignments[discord_user_id] = team_name
+                assign_user_team(discord_user_id, team_name)
             
             await interaction.response.send_message(
                 f"Team {team_name} wurde mit {size} Personen angemeldet.",
@@ -3087,12 +3307,13 @@ async def admin_add_team(interaction, team_name, size, discord_user_id=None, dis
                 event["teams"][team_name] = available_slots
                 
                 # Füge Rest zur Warteliste hinzu
-                event["waitlist"].append((team_name, waitlist_size))
+                event["waitlist"].append(make_waitlist_entry(team_name, waitlist_size))
+                mark_waitlist_changed(event)
                 
                 # Setze Benutzer-Team-Zuweisung, wenn angegeben
                 if discord_user_id:
-                    user_team_assignments[discord_user_id] = team_name
-                    team_requester[team_name] = await bot.fetch_user(int(discord_user_id))
+                    assign_user_team(discord_user_id, team_name)
+                    team_requester[team_name] = await get_user_cached(discord_user_id)
                 
                 await interaction.response.send_message(
                     f"Team {team_name} wurde teilweise angemeldet. "
@@ -3110,12 +3331,13 @@ async def admin_add_team(interaction, team_name, size, discord_user_id=None, dis
                 )
             else:
                 # Komplett auf Warteliste setzen
-                event["waitlist"].append((team_name, size))
+                event["waitlist"].append(make_waitlist_entry(team_name, size))
+                mark_waitlist_changed(event)
                 
                 # Setze Benutzer-Team-Zuweisung, wenn angegeben
                 if discord_user_id:
-                    user_team_assignments[discord_user_id] = team_name
-                    team_requester[team_name] = await bot.fetch_user(int(discord_user_id))
+                    assign_user_team(discord_user_id, team_name)
+                    team_requester[team_name] = await get_user_cached(discord_user_id)
                 
                 await interaction.response.send_message(
                     f"Team {team_name} wurde mit {size} Personen auf die Warteliste gesetzt (Position {len(event['waitlist'])}).",
@@ -3136,7 +3358,7 @@ async def admin_add_team(interaction, team_name, size, discord_user_id=None, dis
     # Benachrichtigung für Discord-Benutzer, wenn angegeben
     if discord_user_id and discord_username:
         try:
-            user = await bot.fetch_user(int(discord_user_id))
+            user = await get_user_cached(discord_user_id)
             if user:
                 # Erstelle eine Benachrichtigung
                 message = f"Hallo {discord_username}! Ein Admin hat dich dem Team **{team_name}** für das Event '{event['name']}' zugewiesen."
@@ -3145,9 +3367,10 @@ async def admin_add_team(interaction, team_name, size, discord_user_id=None, dis
                     message += f" Das Team ist erfolgreich angemeldet mit {event['teams'][team_name]} Spielern."
                 else:
                     # Suche in der Warteliste
-                    for wl_team, wl_size in event["waitlist"]:
+                    for i, entry in enumerate(event["waitlist"]):
+                        wl_team, wl_size = entry["team_name"], entry["size"]
                         if wl_team == team_name:
-                            message += f" Das Team steht auf der Warteliste (Position {event['waitlist'].index((wl_team, wl_size))+1}) mit {wl_size} Spielern."
+                            message += f" Das Team steht auf der Warteliste (Position {i+1}) mit {wl_size} Spielern."
                             break
                 
                 await user.send(message)
@@ -3162,13 +3385,58 @@ async def admin_add_team(interaction, team_name, size, discord_user_id=None, dis
     
     return True
 
+# Zuletzt erstellte Embeds je Art: {art: (Inhalts-Schlüssel des Events, Embed)}
+_embed_cache = {}
+
+def _event_content_key(value):
+    """
+    Bildet einen vergleichbaren Schlüssel aus dem Inhalt eines Events (verschachtelte Dicts/Listen
+    werden zu Tupeln, interne Cache-Schlüssel mit Unterstrich werden ignoriert)
+    """
+    if isinstance(value, dict):
+        return tuple(
+            (key, _event_content_key(item)) for key, item in value.items()
+            if not (isinstance(key, str) and key.startswith("_"))
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_event_content_key(item) for item in value)
+    return value
+
+def _cached_embed(kind, event, builder):
+    """
+    Liefert ein Embed aus dem Cache; es wird nur neu erstellt, wenn sich der Inhalt des Events
+    seit dem letzten Aufruf geändert hat (unabhängig davon, ob die Änderung schon gespeichert wurde)
+    
+    Parameters:
+    - kind: Art des Embeds (z.B. "details" oder "delete_confirm")
+    - event: Eventdaten
+    - builder: Funktion, die das Embed aus den Eventdaten erstellt
+    
+    Returns:
+    - Kopie des (zwischengespeicherten) Embeds oder das Ergebnis des Builders, falls es kein Embed ist
+    """
+    content_key = _event_content_key(event) if event else None
+    cached = _embed_cache.get(kind)
+    if cached and content_key is not None and cached[0] == content_key:
+        return cached[1].copy()
+    
+    embed = builder(event)
+    if isinstance(embed, discord.Embed) and content_key is not None:
+        _embed_cache[kind] = (content_key, embed)
+        return embed.copy()
+    return embed
+
+def get_event_embed(event):
+    """Liefert das Event-Embed (siehe format_event_details), zwischengespeichert pro Event-Inhalt"""
+    return _cached_embed("details", event, format_event_details)
+
 async def send_event_details(channel, event=None):
     """Send event details to a channel with interactive buttons"""
     if event is None:
         event = get_event()
     
     try:
-        embed = format_event_details(event)
+        embed = get_event_embed(event)
         
         # Get the user's roles for button states
         has_admin = False
@@ -3179,10 +3447,10 @@ async def send_event_details(channel, event=None):
         # Check if the message is for a specific user
         if hasattr(channel, 'author'):
             user = channel.author
-            user_id = str(user.id)
+            user_id = user.id
             has_admin = has_role(user, ORGANIZER_ROLE)
             has_clan_rep = has_role(user, CLAN_REP_ROLE)
-            team_name = user_team_assignments.get(user_id)
+            team_name = get_user_team(user_id)
             has_team = team_name is not None
         
         # Add interactive buttons
@@ -3201,7 +3469,10 @@ async def send_event_details(channel, event=None):
 async def on_ready():
     """Handle bot ready event"""
     logger.info(f"Bot eingeloggt als {bot.user}")
-    global channel_id
+    global channel_id, _cached_channel
+    
+    # Nach (Neu-)Verbindung den Channel erneut auflösen
+    _cached_channel = None
     
     # Initialisiere Log-Kanal
     from config import LOG_CHANNEL_NAME, LOG_CHANNEL_ID
@@ -3256,7 +3527,7 @@ async def on_ready():
     
     # Initialisiere Hauptkanal
     if channel_id:
-        channel = bot.get_channel(channel_id)
+        channel = get_event_channel()
         if channel:
             logger.info(f"Channel gefunden: {channel.name}")
             await channel.send("Event-Bot ist online und bereit!")
@@ -3367,7 +3638,7 @@ async def check_waitlist_and_expiry():
                     )
                 
                 if channel_id:
-                    channel = bot.get_channel(channel_id)
+                    channel = get_event_channel()
                     if channel:
                         await channel.send("Das Event ist abgelaufen und wurde gelöscht.")
                 continue
@@ -3378,11 +3649,13 @@ async def check_waitlist_and_expiry():
                 update_needed = False
                 
                 while available_slots > 0 and event["waitlist"]:
-                    team_name, size = event["waitlist"][0]
+                    entry = event["waitlist"][0]
+                    team_name, size = entry["team_name"], entry["size"]
                     
                     if size <= available_slots:
                         # Remove from waitlist and add to registered teams
                         event["waitlist"].pop(0)
+                        mark_waitlist_changed(event)
                         event["slots_used"] += size
                         event["teams"][team_name] = event["teams"].get(team_name, 0) + size
                         available_slots -= size
@@ -3390,7 +3663,7 @@ async def check_waitlist_and_expiry():
                         
                         # Notify team representative
                         if channel_id:
-                            channel = bot.get_channel(channel_id)
+                            channel = get_event_channel()
                             if channel:
                                 await channel.send(f"Team {team_name} wurde von der Warteliste in die Anmeldung aufgenommen!")
                         
@@ -3415,7 +3688,7 @@ async def check_waitlist_and_expiry():
                         )
                     
                     if channel_id:
-                        channel = bot.get_channel(channel_id)
+                        channel = get_event_channel()
                         if channel:
                             await send_event_details(channel)
         
@@ -3427,16 +3700,17 @@ async def check_waitlist_and_expiry():
 async def set_channel(interaction: discord.Interaction):
     """Set the current channel for event updates"""
     # Kommandoausführung loggen
-    logger.info(f"Slash-Command: /set_channel ausgeführt von {interaction.user.name} ({interaction.user.id}) in Kanal {interaction.channel.name}")
+    logger.info("Slash-Command: /%s ausgeführt von %s (%s) in Kanal %s", "set_channel", interaction.user.name, interaction.user.id, interaction.channel.name)
     
     # Überprüfe Berechtigungen
     if not interaction.user.guild_permissions.manage_channels:
-        logger.warning(f"Berechtigungsfehler: {interaction.user.name} ({interaction.user.id}) hat versucht, /set_channel ohne ausreichende Berechtigungen zu verwenden")
+        logger.warning("Berechtigungsfehler: %s (%s) hat versucht, /%s ohne ausreichende Berechtigungen zu verwenden", interaction.user.name, interaction.user.id, "set_channel")
         await interaction.response.send_message("Du benötigst 'Kanäle verwalten'-Berechtigungen, um diesen Befehl zu nutzen.", ephemeral=True)
         return
         
-    global channel_id
+    global channel_id, _cached_channel
     channel_id = interaction.channel_id
+    _cached_channel = interaction.channel
     save_data(event_data, channel_id, user_team_assignments)
     
     # Log für Channel-Setzung
@@ -3446,24 +3720,16 @@ async def set_channel(interaction: discord.Interaction):
     )
     
     await interaction.response.send_message(f"Dieser Channel ({interaction.channel.name}) wurde erfolgreich für Event-Interaktionen gesetzt.")
-    logger.info(f"Channel gesetzt: {interaction.channel.name} (ID: {channel_id})")
+    logger.info("Channel gesetzt: %s (ID: %s)", interaction.channel.name, channel_id)
 
 # Event commands
 @bot.tree.command(name="event", description="Erstellt ein neues Event (nur für Orga-Team)")
+@organizer_only()
 async def create_event_command(interaction: discord.Interaction):
     """Create a new event"""
     # Kommandoausführung loggen
-    logger.info(f"Slash-Command: /event ausgeführt von {interaction.user.name} ({interaction.user.id}) in Kanal {interaction.channel.name}")
+    logger.info("Slash-Command: /%s ausgeführt von %s (%s) in Kanal %s", "event", interaction.user.name, interaction.user.id, interaction.channel.name)
     
-    # Überprüfe Rolle
-    if not has_role(interaction.user, ORGANIZER_ROLE):
-        logger.warning(f"Berechtigungsfehler: {interaction.user.name} ({interaction.user.id}) hat versucht, /event ohne ausreichende Berechtigungen zu verwenden")
-        await interaction.response.send_message(
-            f"Nur Mitglieder mit der Rolle '{ORGANIZER_ROLE}' können Events erstellen.",
-            ephemeral=True
-        )
-        return
-        
     # Zeige das Modal an
     modal = EventCreationModal()
     await interaction.response.send_modal(modal)
@@ -3527,14 +3793,14 @@ class EventCreationModal(ui.Modal):
 async def create_event_internal(interaction: discord.Interaction, name: str, date: str, time: str, description: str):
     """Internal function to handle event creation after modal submission"""
     # Kommandoausführung loggen
-    logger.info(f"Event-Erstellung: {interaction.user.name} ({interaction.user.id}) erstellt Event mit Parametern: name='{name}', date='{date}', time='{time}'")
+    logger.info("Event-Erstellung: %s (%s) erstellt Event mit Parametern: name='%s', date='%s', time='%s'", interaction.user.name, interaction.user.id, name, date, time)
 
     if get_event():
         await interaction.response.send_message("Es existiert bereits ein aktives Event. Bitte lösche es zuerst mit /delete_event.")
         return
     
     # Validate date format
-    event_date = parse_date(date)
+    event_date = parse_date_fast(date)
     if not event_date:
         await interaction.response.send_message("Ungültiges Datumsformat. Bitte verwende das Format TT.MM.JJJJ.")
         return
@@ -3553,52 +3819,25 @@ async def create_event_internal(interaction: discord.Interaction, name: str, dat
         "expiry_date": event_date + timedelta(days=1)
     }
 
-    save_data(event_data, channel_id, user_team_assignments)
-    await interaction.response.send_message("Event erfolgreich erstellt!")
+    schedule_save()
+    
+    # Check roles for this specific user
+    perms = get_perms(interaction)
+    
+    # Bestätigung und Event-Details in einer Antwort senden
+    event = get_event()
+    embed = get_event_embed(event)
+    view = EventActionView(event, perms.is_admin, perms.is_clan_rep, perms.has_team, perms.team_name)
+    await interaction.response.send_message("Event erfolgreich erstellt!", embed=embed, view=view)
     
     # Log zum Erstellen des Events
     await send_to_log_channel(
         f"🆕 Event erstellt: '{name}' am {date} um {time} durch {interaction.user.name}",
         guild=interaction.guild
     )
-    
-    # Get channel after creating the event
-    channel = bot.get_channel(interaction.channel_id)
-    if channel:
-        # Check roles for this specific user
-        user_id = str(interaction.user.id)
-        has_admin = has_role(interaction.user, ORGANIZER_ROLE)
-        has_clan_rep = has_role(interaction.user, CLAN_REP_ROLE)
-        team_name = user_team_assignments.get(user_id)
-        has_team = team_name is not None
-        
-        # Create embed
-        embed = format_event_details(get_event())
-        view = EventActionView(get_event(), has_admin, has_clan_rep, has_team, team_name)
-        
-        await channel.send(embed=embed, view=view)
-
-@bot.tree.command(name="delete_event", description="Löscht das aktuelle Event (nur für Orga-Team)")
-async def delete_event(interaction: discord.Interaction):
-    """Delete the current event"""
-    # Kommandoausführung loggen
-    logger.info(f"Slash-Command: /delete_event ausgeführt von {interaction.user.name} ({interaction.user.id}) in Kanal {interaction.channel.name}")
-    
-    # Überprüfe Rolle
-    if not has_role(interaction.user, ORGANIZER_ROLE):
-        logger.warning(f"Berechtigungsfehler: {interaction.user.name} ({interaction.user.id}) hat versucht, /delete_event ohne ausreichende Berechtigungen zu verwenden")
-        await send_feedback(interaction,
-            f"Nur Mitglieder mit der Rolle '{ORGANIZER_ROLE}' können Events löschen.", 
-            ephemeral=True
-        )
-        return
 
-    event = get_event()
-    if not event:
-        await send_feedback(interaction, "Es gibt kein aktives Event zum Löschen.", ephemeral=True)
-        return
-    
-    # Zeige eine Bestätigungsanfrage mit den Konsequenzen des Löschens
+def _build_delete_embed(event):
+    """Erstellt das Bestätigungs-Embed für /delete_event"""
     embed = discord.Embed(
         title="⚠️ Event wirklich löschen?",
         description=f"Bist du sicher, dass du das Event **{event['name']}** löschen möchtest?\n\n"
@@ -3615,6 +3854,27 @@ async def delete_event(interaction: discord.Interaction):
               f"**Teams auf Warteliste:** {len(event['waitlist'])}"
     )
     
+    return embed
+
+def _get_or_build_delete_embed(event):
+    """Liefert das Bestätigungs-Embed für /delete_event, zwischengespeichert pro Event-Inhalt"""
+    return _cached_embed("delete_confirm", event, _build_delete_embed)
+
+@bot.tree.command(name="delete_event", description="Löscht das aktuelle Event (nur für Orga-Team)")
+@organizer_only()
+async def delete_event(interaction: discord.Interaction):
+    """Delete the current event"""
+    # Kommandoausführung loggen
+    logger.info("Slash-Command: /%s ausgeführt von %s (%s) in Kanal %s", "delete_event", interaction.user.name, interaction.user.id, interaction.channel.name)
+    
+    event = get_event()
+    if not event:
+        await send_feedback(interaction, "Es gibt kein aktives Event zum Löschen.", ephemeral=True)
+        return
+    
+    # Zeige eine Bestätigungsanfrage mit den Konsequenzen des Löschens
+    embed = _get_or_build_delete_embed(event)
+    
     # Verwende die vorhandene Bestätigungsansicht
     view = DeleteConfirmationView()
     await send_feedback(interaction, "", embed=embed, view=view, ephemeral=True)
@@ -3632,24 +3892,13 @@ async def show_event(interaction: discord.Interaction):
         await interaction.response.send_message("Es gibt derzeit kein aktives Event.", ephemeral=True)
         return
     
-    # Es gibt ein Event, zeige die Details mit Buttons
-    await interaction.response.send_message("Hier sind die Event-Details:")
-    
-    # Get channel after sending initial response
-    channel = bot.get_channel(interaction.channel_id)
-    if channel:
-        # Check roles for this specific user
-        user_id = str(interaction.user.id)
-        has_admin = has_role(interaction.user, ORGANIZER_ROLE)
-        has_clan_rep = has_role(interaction.user, CLAN_REP_ROLE)
-        team_name = user_team_assignments.get(user_id)
-        has_team = team_name is not None
-        
-        # Create embed
-        embed = format_event_details(event)
-        view = EventActionView(event, has_admin, has_clan_rep, has_team, team_name)
-        
-        await channel.send(embed=embed, view=view)
+    # Check roles for this specific user
+    perms = get_perms(interaction)
+    
+    # Es gibt ein Event, zeige die Details mit Buttons in einer einzigen Antwort
+    embed = get_event_embed(event)
+    view = EventActionView(event, perms.is_admin, perms.is_clan_rep, perms.has_team, perms.team_name)
+    await interaction.response.send_message(embed=embed, view=view)
 
 # Registration commands
 @bot.tree.command(name="reg", description="Meldet dein Team an oder ändert die Teamgröße (nur für Clan-Rep)")
@@ -3666,15 +3915,16 @@ async def register_team(interaction: discord.Interaction, team_name: str, size:
 
     # Normalisiere den Team-Namen
     team_name = team_name.strip()
-    user_id = str(interaction.user.id)
+    team_name_lower = team_name.lower()
+    user_id = interaction.user.id
 
     # Validiere die Teamgröße
     if not await validate_team_size(interaction, size, event["max_team_size"]):
         return
 
     # Prüfe, ob der Nutzer bereits einem anderen Team zugewiesen ist
-    if user_id in user_team_assignments and user_team_assignments[user_id].lower() != team_name.lower():
-        assigned_team = user_team_assignments[user_id]
+    if user_id in user_team_assignments and user_team_assignments[user_id][1] != team_name_lower:
+        assigned_team = user_team_assignments[user_id][0]
         await send_feedback(
             interaction,
             f"Du bist bereits dem Team '{assigned_team}' zugewiesen. Du kannst nur für ein Team anmelden.",
@@ -3698,7 +3948,7 @@ async def register_team(interaction: discord.Interaction, team_name: str, size:
     
     if success:
         # Speichere Daten nach jeder Änderung
-        save_data(event_data, channel_id, user_team_assignments)
+        schedule_save()
         
         # Aktualisiere die Event-Anzeige
         await update_event_displays(interaction=interaction)
@@ -3706,16 +3956,9 @@ async def register_team(interaction: discord.Interaction, team_name: str, size:
 # Der /wl-Befehl wurde entfernt, da die Warteliste jetzt automatisch vom Bot verwaltet wird
 
 @bot.tree.command(name="open_reg", description="Erhöht die maximale Teamgröße oder entfernt die Begrenzung (nur für Orga-Team)")
+@organizer_only()
 async def open_registration(interaction: discord.Interaction):
     """Increases maximum team size or removes the limit (admin only)"""
-    # Überprüfe Rolle
-    if not has_role(interaction.user, ORGANIZER_ROLE):
-        await send_feedback(interaction,
-            f"Nur Mitglieder mit der Rolle '{ORGANIZER_ROLE}' können die Registrierung öffnen.",
-            ephemeral=True
-        )
-        return
-
     event = get_event()
     if not event:
         await send_feedback(interaction, "Es gibt derzeit kein aktives Event.")
@@ -3748,7 +3991,7 @@ async def open_registration(interaction: discord.Interaction):
     
     # Aktualisiere die maximale Teamgröße
     event["max_team_size"] = new_max_size
-    save_data(event_data, channel_id, user_team_assignments)
+    schedule_save()
     
     # Log für die Änderung der maximalen Teamgröße
     log_message = f"⬆️ Teamgröße angepasst: Admin {interaction.user.name} hat die maximale Teamgröße für Event '{event['name']}' von {old_max_size} auf {new_max_size} geändert"
@@ -3759,7 +4002,7 @@ async def open_registration(interaction: discord.Interaction):
     
     # Ankündigung im Event-Kanal
     if channel_id:
-        channel = bot.get_channel(channel_id)
+        channel = get_event_channel()
         if channel:
             channel_message = f"📢 **Ankündigung**: Die maximale Teamgröße für das Event '{event['name']}' wurde angepasst! {message}"
             await channel.send(channel_message)
@@ -3769,25 +4012,17 @@ async def open_registration(interaction: discord.Interaction):
 @app_commands.describe(
     user="Der Nutzer, dessen Team-Zuweisung zurückgesetzt werden soll"
 )
+@organizer_only()
 async def reset_team_assignment(interaction: discord.Interaction, user: discord.User):
     """Reset a user's team assignment (admin only)"""
-    # Überprüfe Rolle
-    if not has_role(interaction.user, ORGANIZER_ROLE):
-        await interaction.response.send_message(
-            f"Nur Mitglieder mit der Rolle '{ORGANIZER_ROLE}' können diese Aktion ausführen.",
-            ephemeral=True
-        )
-        return
-
-    user_id = str(user.id)
+    user_id = user.id
     
     if user_id not in user_team_assignments:
         await interaction.response.send_message(f"{user.display_name} ist keinem Team zugewiesen.")
         return
     
-    team_name = user_team_assignments[user_id]
-    del user_team_assignments[user_id]
-    save_data(event_data, channel_id, user_team_assignments)
+    team_name = unassign_user(user_id)
+    schedule_save()
     
     # Log für Zurücksetzen der Team-Zuweisung
     await send_to_log_channel(
@@ -3810,6 +4045,17 @@ async def reset_team_assignment(interaction: discord.Interaction, user: discord.
         pass
 
 # Team List and CSV Export Commands
+
+# Übersetzungstabelle für Dateinamen (TT.MM.JJJJ -> TT-MM-JJJJ)
+_DOT_TO_DASH = str.maketrans({'.': '-'})
+
+def _csv_escape(value):
+    """Maskiert einen CSV-Wert nur, wenn er Trennzeichen, Anführungszeichen oder Zeilenumbrüche enthält"""
+    value = str(value)
+    if ',' in value or '"' in value or '\n' in value or '\r' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
 @bot.tree.command(name="team_list", description="Zeigt eine schön formatierte Liste aller angemeldeten Teams")
 async def team_list(interaction: discord.Interaction):
     """Display a formatted list of all registered teams"""
@@ -3827,22 +4073,23 @@ async def team_list(interaction: discord.Interaction):
     
     # Add registered teams section
     if event["teams"]:
-        registered_text = ""
-        # Prüfe, ob das Team-Dictionary jetzt das erweiterte Format mit IDs verwendet
-        using_team_ids = False
-        if event["teams"] and isinstance(next(iter(event["teams"].values())), dict):
-            using_team_ids = True
+        parts = []
+        teams = event["teams"]
+        sorted_names = get_sorted_team_names(event)
         
-        if using_team_ids:
+        if event.get("schema", SCHEMA_LEGACY) >= SCHEMA_V2:
             # Neues Format mit Team-IDs
-            for idx, (team_name, data) in enumerate(sorted(event["teams"].items()), 1):
+            for idx, team_name in enumerate(sorted_names, 1):
+                data = teams[team_name]
                 team_size = data.get("size", 0)
                 team_id = data.get("id", "")
-                registered_text += f"**{idx}.** {team_name.capitalize()} - {team_size} Mitglieder | ID: `{team_id}`\n"
+                parts.append(f"**{idx}.** {team_name.capitalize()} - {team_size} Mitglieder | ID: `{team_id}`")
         else:
             # Altes Format ohne Team-IDs
-            for idx, (team_name, size) in enumerate(sorted(event["teams"].items()), 1):
-                registered_text += f"**{idx}.** {team_name.capitalize()} - {size} Mitglieder\n"
+            for idx, team_name in enumerate(sorted_names, 1):
+                size = teams[team_name]
+                parts.append(f"**{idx}.** {team_name.capitalize()} - {size} Mitglieder")
+        registered_text = "\n".join(parts) + "\n"
         
         embed.add_field(
             name=f"📋 Angemeldete Teams ({event['slots_used']}/{event['max_slots']} Slots)",
@@ -3858,22 +4105,13 @@ async def team_list(interaction: discord.Interaction):
     
     # Add waitlist section
     if event["waitlist"]:
-        waitlist_text = ""
-        # Prüfe, ob die Warteliste das erweiterte Format mit IDs verwendet
-        using_waitlist_ids = False
-        if event["waitlist"] and len(event["waitlist"][0]) > 2:
-            using_waitlist_ids = True
-        
-        if using_waitlist_ids:
-            # Neues Format mit Team-IDs
-            for idx, entry in enumerate(event["waitlist"], 1):
-                if len(entry) >= 3:  # Format: (team_name, size, team_id)
-                    team_name, size, team_id = entry
-                    waitlist_text += f"**{idx}.** {team_name.capitalize()} - {size} Mitglieder | ID: `{team_id}`\n"
-        else:
-            # Altes Format ohne Team-IDs
-            for idx, (team_name, size) in enumerate(event["waitlist"], 1):
-                waitlist_text += f"**{idx}.** {team_name.capitalize()} - {size} Mitglieder\n"
+        parts = []
+        for idx, entry in enumerate(event["waitlist"], 1):
+            line = f"**{idx}.** {entry['team_name'].capitalize()} - {entry['size']} Mitglieder"
+            if entry["team_id"] is not None:
+                line += f" | ID: `{entry['team_id']}`"
+            parts.append(line)
+        waitlist_text = "\n".join(parts) + "\n"
         
         embed.add_field(
             name="⏳ Warteliste",
@@ -3898,40 +4136,31 @@ async def team_list(interaction: discord.Interaction):
         inline=False
     )
     
-    embed.set_footer(text=f"Erstellt am {datetime.now().strftime('%d.%m.%Y um %H:%M')} Uhr")
+    now = datetime.now()
+    embed.set_footer(text=f"Erstellt am {now.day:02d}.{now.month:02d}.{now.year} um {now.hour:02d}:{now.minute:02d} Uhr")
     
     await interaction.response.send_message(embed=embed)
 
-@bot.tree.command(name="export_csv", description="Exportiert die Teamliste als CSV-Datei (nur für Orga-Team)")
-async def export_csv(interaction: discord.Interaction):
-    """Export team data as CSV file"""
-    # Überprüfe Berechtigung
-    if not has_role(interaction.user, ORGANIZER_ROLE):
-        await interaction.response.send_message(
-            f"Nur Mitglieder mit der Rolle '{ORGANIZER_ROLE}' können Team-Daten exportieren.",
-            ephemeral=True
-        )
-        return
+def _build_csv_buffer(event):
+    """
+    Erstellt die CSV-Datei mit allen Teams und der Warteliste (läuft in einem Worker-Thread)
     
-    event = get_event()
-    if not event:
-        await interaction.response.send_message("Es gibt derzeit kein aktives Event.")
-        return
+    Parameters:
+    - event: Eventdaten (Momentaufnahme von Teams und Warteliste)
     
-    # Create CSV in memory
-    output = io.StringIO()
-    csv_writer = csv.writer(output)
+    Returns:
+    - BytesIO mit dem UTF-8-kodierten CSV-Inhalt, auf Position 0 gesetzt
+    """
+    # Create CSV in memory (direkt als UTF-8 in den Byte-Puffer schreiben)
+    buf = io.BytesIO()
+    text = io.TextIOWrapper(buf, encoding='utf-8', newline='', write_through=True)
+    csv_writer = csv.writer(text)
     
     # Write header
     csv_writer.writerow(["Team", "Größe", "Status", "Team-ID"])
     
     # Write registered teams
-    # Prüfe, ob das Team-Dictionary das erweiterte Format mit IDs verwendet
-    using_team_ids = False
-    if event["teams"] and isinstance(next(iter(event["teams"].values())), dict):
-        using_team_ids = True
-    
-    if using_team_ids:
+    if event.get("schema", SCHEMA_LEGACY) >= SCHEMA_V2:
         # Neues Format mit Team-IDs
         for team_name, data in event["teams"].items():
             size = data.get("size", 0)
@@ -3943,49 +4172,56 @@ async def export_csv(interaction: discord.Interaction):
             csv_writer.writerow([team_name, size, "Angemeldet", ""])
     
     # Write waitlist teams
-    # Prüfe, ob die Warteliste das erweiterte Format mit IDs verwendet
-    using_waitlist_ids = False
-    if event["waitlist"] and len(event["waitlist"][0]) > 2:
-        using_waitlist_ids = True
-    
-    if using_waitlist_ids:
-        # Neues Format mit Team-IDs
-        for entry in event["waitlist"]:
-            if len(entry) >= 3:  # Format: (team_name, size, team_id)
-                team_name, size, team_id = entry
-                csv_writer.writerow([team_name, size, "Warteliste", team_id])
-    else:
-        # Altes Format ohne Team-IDs
-        for team_name, size in event["waitlist"]:
-            csv_writer.writerow([team_name, size, "Warteliste", ""])
+    for entry in event["waitlist"]:
+        csv_writer.writerow([entry["team_name"], entry["size"], "Warteliste", entry["team_id"] or ""])
+    
+    # Wrapper lösen, damit der Byte-Puffer nicht mit ihm geschlossen wird
+    text.flush()
+    text.detach()
+    buf.seek(0)
+    return buf
+
+@bot.tree.command(name="export_csv", description="Exportiert die Teamliste als CSV-Datei (nur für Orga-Team)")
+@organizer_only()
+async def export_csv(interaction: discord.Interaction):
+    """Export team data as CSV file"""
+    event = get_event()
+    if not event:
+        await interaction.response.send_message("Es gibt derzeit kein aktives Event.")
+        return
     
-    # Reset stream position to start
-    output.seek(0)
+    # Momentaufnahme, damit parallele Änderungen den Export-Thread nicht stören
+    snapshot = {
+        "teams": dict(event["teams"]),
+        "waitlist": list(event["waitlist"]),
+        "schema": event.get("schema", SCHEMA_LEGACY)
+    }
+    buf = await asyncio.to_thread(_build_csv_buffer, snapshot)
     
     # Create discord file object
-    event_date = event["date"].replace(".", "-")
+    event_date = event["date"].translate(_DOT_TO_DASH)
     filename = f"teams_{event_date}.csv"
-    file = discord.File(fp=io.BytesIO(output.getvalue().encode('utf-8')), filename=filename)
+    file = discord.File(fp=buf, filename=filename)
     
     await interaction.response.send_message(f"Hier ist die exportierte Teamliste für {event['name']}:", file=file)
 
-@bot.tree.command(name="help", description="Zeigt Hilfe zu den verfügbaren Befehlen")
-async def help_command(interaction: discord.Interaction):
-    """Show help information"""
-    # Kommandoausführung loggen
-    logger.info(f"Slash-Command: /help ausgeführt von {interaction.user.name} ({interaction.user.id}) in Kanal {interaction.channel.name}")
+def _build_help_embed(is_admin, is_clan_rep):
+    """
+    Erstellt das Hilfe-Embed für eine Rollenkombination
+    
+    Parameters:
+    - is_admin: Ob der Benutzer die Orga-Rolle hat
+    - is_clan_rep: Ob der Benutzer die Clan-Rep-Rolle hat
     
-    # Create help embed
+    Returns:
+    - discord.Embed mit den verfügbaren Befehlen
+    """
     embed = discord.Embed(
         title="📚 Event-Bot Hilfe",
         description="Hier sind die verfügbaren Befehle:",
         color=discord.Color.blue()
     )
     
-    # Get user roles
-    is_admin = has_role(interaction.user, ORGANIZER_ROLE)
-    is_clan_rep = has_role(interaction.user, CLAN_REP_ROLE)
-    
     # Basic commands for everyone
     embed.add_field(
         name="🔍 Allgemeine Befehle",
@@ -4024,6 +4260,25 @@ async def help_command(interaction: discord.Interaction):
             inline=False
         )
     
+    return embed
+
+# Vorgefertigte Hilfe-Embeds für alle Kombinationen aus (is_admin, is_clan_rep)
+HELP_EMBEDS = {
+    (is_admin, is_clan_rep): _build_help_embed(is_admin, is_clan_rep)
+    for is_admin in (False, True)
+    for is_clan_rep in (False, True)
+}
+
+@bot.tree.command(name="help", description="Zeigt Hilfe zu den verfügbaren Befehlen")
+async def help_command(interaction: discord.Interaction):
+    """Show help information"""
+    # Kommandoausführung loggen
+    logger.info("Slash-Command: /%s ausgeführt von %s (%s) in Kanal %s", "help", interaction.user.name, interaction.user.id, interaction.channel.name)
+    
+    # Get user roles
+    perms = get_perms(interaction)
+    
+    embed = HELP_EMBEDS[(perms.is_admin, perms.is_clan_rep)].copy()
     await send_feedback(interaction, "", embed=embed, ephemeral=True)
 
 
@@ -4036,13 +4291,12 @@ async def unregister_command(interaction: discord.Interaction, team_name: str =
     if not event:
         return
     
-    # Definiere user_id aus der Interaktion
-    user_id = str(interaction.user.id)
+    perms = get_perms(interaction)
     
     # Wenn kein Team-Name angegeben wurde, versuche das zugeordnete Team zu finden
     if not team_name:
-        if user_id in user_team_assignments:
-            team_name = user_team_assignments[user_id]
+        if perms.has_team:
+            team_name = perms.team_name
         else:
             await send_feedback(
                 interaction,
@@ -4052,8 +4306,9 @@ async def unregister_command(interaction: discord.Interaction, team_name: str =
             return
     
     # Prüfe Berechtigungen
-    is_admin = has_role(interaction.user, ORGANIZER_ROLE)
-    is_assigned_to_team = (user_id in user_team_assignments and user_team_assignments[user_id].lower() == team_name.lower())
+    is_admin = perms.is_admin
+    assignment = user_team_assignments.get(interaction.user.id)
+    is_assigned_to_team = assignment is not None and assignment[1] == team_name.lower()
     
     if not is_admin and not is_assigned_to_team:
         await send_feedback(
@@ -4067,10 +4322,11 @@ async def unregister_command(interaction: discord.Interaction, team_name: str =
     await handle_team_unregistration(interaction, team_name, is_admin)
 
 @bot.tree.command(name="update", description="Aktualisiert die Details des aktuellen Events")
+@organizer_only()
 async def update_command(interaction: discord.Interaction):
     """Aktualisiert die Event-Details im Kanal"""
-    # Validiere den Befehlskontext (Rolle, Event)
-    event, _ = await validate_command_context(interaction, required_role=ORGANIZER_ROLE)
+    # Validiere den Befehlskontext (Event; die Rolle prüft organizer_only)
+    event, _ = await validate_command_context(interaction)
     if not event:
         return
     
@@ -4083,7 +4339,7 @@ async def update_command(interaction: discord.Interaction):
         )
         return
     
-    channel = bot.get_channel(channel_id)
+    channel = get_event_channel()
     if not channel:
         await send_feedback(
             interaction,
@@ -4132,19 +4388,20 @@ async def edit_command(interaction: discord.Interaction):
     display_name = registered_name if registered_name else team_name
     
     # Prüfe Admin-Status für erweiterte Optionen
-    is_admin = has_role(interaction.user, ORGANIZER_ROLE)
+    is_admin = get_perms(interaction).is_admin
     
     modal = TeamEditModal(display_name, total_size, event["max_team_size"], is_admin=is_admin)
     await interaction.response.send_modal(modal)
 
 @bot.tree.command(name="close", description="Schließt die Anmeldungen für das aktuelle Event (nur für Orga-Team)")
+@organizer_only()
 async def close_command(interaction: discord.Interaction):
     """Schließt die Anmeldungen für das Event"""
     # Kommandoausführung loggen
-    logger.info(f"Slash-Command: /close ausgeführt von {interaction.user.name} ({interaction.user.id}) in Kanal {interaction.channel.name}")
+    logger.info("Slash-Command: /%s ausgeführt von %s (%s) in Kanal %s", "close", interaction.user.name, interaction.user.id, interaction.channel.name)
     
-    # Validiere den Befehlskontext (Rolle, Event)
-    event, _ = await validate_command_context(interaction, required_role=ORGANIZER_ROLE)
+    # Validiere den Befehlskontext (Event; die Rolle prüft organizer_only)
+    event, _ = await validate_command_context(interaction)
     if not event:
         return
     
@@ -4152,7 +4409,7 @@ async def close_command(interaction: discord.Interaction):
     event["max_slots"] = event["slots_used"]
     
     # Speichere die Änderungen
-    save_data(event_data, channel_id, user_team_assignments)
+    schedule_save()
     
     await send_feedback(
         interaction,
@@ -4171,13 +4428,14 @@ async def close_command(interaction: discord.Interaction):
     await update_event_displays(interaction=interaction)
 
 @bot.tree.command(name="open", description="Öffnet die Anmeldungen für das aktuelle Event wieder (nur für Orga-Team)")
+@organizer_only()
 async def open_command(interaction: discord.Interaction):
     """Öffnet die Anmeldungen für das Event wieder"""
     # Kommandoausführung loggen
-    logger.info(f"Slash-Command: /open ausgeführt von {interaction.user.name} ({interaction.user.id}) in Kanal {interaction.channel.name}")
+    logger.info("Slash-Command: /%s ausgeführt von %s (%s) in Kanal %s", "open", interaction.user.name, interaction.user.id, interaction.channel.name)
     
-    # Validiere den Befehlskontext (Rolle, Event)
-    event, _ = await validate_command_context(interaction, required_role=ORGANIZER_ROLE)
+    # Validiere den Befehlskontext (Event; die Rolle prüft organizer_only)
+    event, _ = await validate_command_context(interaction)
     if not event:
         return
     
@@ -4188,7 +4446,7 @@ async def open_command(interaction: discord.Interaction):
     event["max_slots"] = DEFAULT_MAX_SLOTS
     
     # Speichere die Änderungen
-    save_data(event_data, channel_id, user_team_assignments)
+    schedule_save()
     
     # Berechne wie viele Slots wieder verfügbar sind
     new_available_slots = DEFAULT_MAX_SLOTS - event["slots_used"]
@@ -4215,6 +4473,12 @@ async def open_command(interaction: discord.Interaction):
     # Aktualisiere die Event-Details im Kanal
     await update_event_displays(interaction=interaction)
 
+# Einzahl/Mehrzahl für Personenangaben, Index: size == 1
+_PLURAL = ("Personen", "Person")
+
+# Maximale Länge der /find-Antwort (Discord erlaubt 2000 Zeichen pro Nachricht)
+FIND_MESSAGE_LIMIT = 1900
+
 @bot.tree.command(name="find", description="Findet ein Team oder einen Spieler im Event")
 async def find_command(interaction: discord.Interaction, search_term: str):
     """Findet ein Team oder einen Spieler im Event"""
@@ -4224,87 +4488,121 @@ async def find_command(interaction: discord.Interaction, search_term: str):
         return
     
     search_term = search_term.lower()
+    # Literal-Muster einmalig kompilieren, damit pro Zeile kein lower() nötig ist
+    pattern = re.compile(re.escape(search_term), re.IGNORECASE)
     results = []
     
-    # Prüfe, ob das Team-Dictionary das erweiterte Format mit IDs verwendet
-    using_team_ids = False
-    if event["teams"] and isinstance(next(iter(event["teams"].values())), dict):
-        using_team_ids = True
+    # Laufende Nachrichtenlänge: Sobald das Limit erreicht ist, wird nicht weiter gesucht
+    header = f"**🔍 Suchergebnisse für '{search_term}':**\n\n"
+    total_len = len(header)
+    truncated = False
+    
+    # Format-Flags werden beim Laden/Speichern des Events gesetzt
+    using_team_ids = event.get("schema", SCHEMA_LEGACY) >= SCHEMA_V2
+    
+    # Team-Index einmalig aufbauen: Teamname (lowercase) -> [Event-Größe, Wartelisten-Größe, erste Wartelisten-Position]
+    team_idx = {}
+    for team_name, data in event["teams"].items():
+        size = data.get("size", 0) if using_team_ids else data
+        team_idx[team_name.lower()] = [size, 0, None]
+    for i, entry in enumerate(event["waitlist"]):
+        info = team_idx.setdefault(entry["team_name"].lower(), [0, 0, None])
+        info[1] += entry["size"]
+        if info[2] is None:
+            info[2] = i + 1
     
     # Suche in registrierten Teams
-    if using_team_ids:
-        # Neues Format mit Team-IDs
-        for team_name, data in event["teams"].items():
-            if search_term in team_name.lower():
+    for team_name, data in event["teams"].items():
+        if len(search_term) <= len(team_name) and pattern.search(team_name):
+            if using_team_ids:
+                # Neues Format mit Team-IDs
                 size = data.get("size", 0)
                 team_id = data.get("id", "keine ID")
-                results.append(f"✅ **{team_name}**: {size} {'Person' if size == 1 else 'Personen'} (Angemeldet, ID: {team_id})")
-    else:
-        # Altes Format
-        for team_name, size in event["teams"].items():
-            if search_term in team_name.lower():
-                results.append(f"✅ **{team_name}**: {size} {'Person' if size == 1 else 'Personen'} (Angemeldet)")
-    
-    # Prüfe, ob die Warteliste das erweiterte Format mit IDs verwendet
-    using_waitlist_ids = False
-    if event["waitlist"] and len(event["waitlist"][0]) > 2:
-        using_waitlist_ids = True
+                line = f"✅ **{team_name}**: {size} {_PLURAL[size == 1]} (Angemeldet, ID: {team_id})"
+            else:
+                # Altes Format
+                size = data
+                line = f"✅ **{team_name}**: {size} {_PLURAL[size == 1]} (Angemeldet)"
+            results.append(line)
+            total_len += len(line) + 1
+            if total_len >= FIND_MESSAGE_LIMIT:
+                truncated = True
+                break
     
     # Suche in Warteliste
-    if using_waitlist_ids:
-        # Neues Format mit Team-IDs
+    if not truncated:
         for i, entry in enumerate(event["waitlist"]):
-            if len(entry) >= 3:  # Format: (team_name, size, team_id)
-                team_name, size, team_id = entry
-                if search_term in team_name.lower():
-                    results.append(f"⏳ **{team_name}**: {size} {'Person' if size == 1 else 'Personen'} (Warteliste Position {i+1}, ID: {team_id})")
-    else:
-        # Altes Format
-        for i, (team_name, size) in enumerate(event["waitlist"]):
-            if search_term in team_name.lower():
-                results.append(f"⏳ **{team_name}**: {size} {'Person' if size == 1 else 'Personen'} (Warteliste Position {i+1})")
+            if len(search_term) <= len(entry["team_name"]) and pattern.search(entry["team_name"]):
+                team_name, size, team_id = entry["team_name"], entry["size"], entry["team_id"]
+                id_text = f", ID: {team_id}" if team_id is not None else ""
+                line = f"⏳ **{team_name}**: {size} {_PLURAL[size == 1]} (Warteliste Position {i+1}{id_text})"
+                results.append(line)
+                total_len += len(line) + 1
+                if total_len >= FIND_MESSAGE_LIMIT:
+                    truncated = True
+                    break
     
     # Suche nach zugewiesenen Benutzern (Discord-ID -> Team)
-    user_results = []
-    for user_id, team_name in user_team_assignments.items():
-        # Versuche, den Benutzer zu finden
-        try:
-            user = await bot.fetch_user(int(user_id))
-            if search_term in user.name.lower() or search_term in str(user.id):
-                # Hole die Team-Details
-                event_size, waitlist_size, total_size, registered_name, _ = get_team_total_size(event, team_name)
+    # Benutzer werden in Blöcken von FETCH_CONCURRENCY parallel abgerufen (begrenzt, um
+    # Rate-Limits zu vermeiden); ist die Nachricht voll, entfallen die restlichen Abrufe
+    candidates = tuple(user_team_assignments.items())
+    if search_term.isdecimal():
+        # Exakte Discord-ID: diesen Benutzer zuerst abrufen, damit er auch bei gekürzter
+        # Ausgabe erscheint; Teiltreffer bei anderen Benutzern werden weiterhin gesucht
+        exact_id = int(search_term)
+        direct = user_team_assignments.get(exact_id)
+        if direct:
+            candidates = ((exact_id, direct),) + tuple(
+                candidate for candidate in candidates if candidate[0] != exact_id
+            )
+    for start in range(0, len(candidates), FETCH_CONCURRENCY):
+        if truncated:
+            break
+        batch = candidates[start:start + FETCH_CONCURRENCY]
+        fetched = await asyncio.gather(
+            *(get_user_cached(user_id) for user_id, _ in batch),
+            return_exceptions=True
+        )
+        
+        for (user_id, (team_name, assigned_team_lower)), user in zip(batch, fetched):
+            if isinstance(user, Exception):
+                # Bei Fehler einfach überspringen
+                logger.error(f"Fehler beim Suchen des Benutzers {user_id}: {user}")
+                continue
+            try:
+                # Längere Suchbegriffe können nie enthalten sein
+                name_match = len(search_term) <= len(user.name) and pattern.search(user.name) is not None
+                if not (name_match or search_term in str(user.id)):
+                    continue
+                
+                # Hole die Team-Details aus dem Index
+                event_size, waitlist_size, waitlist_position = team_idx.get(assigned_team_lower, (0, 0, None))
+                total_size = event_size + waitlist_size
                 
                 if event_size > 0:
-                    user_results.append(f"👤 **{user.name}** (ID: {user.id}) ist in Team **{team_name}** (Angemeldet, Größe: {total_size})")
+                    line = f"👤 **{user.name}** (ID: {user.id}) ist in Team **{team_name}** (Angemeldet, Größe: {total_size})"
                 elif waitlist_size > 0:
-                    # Finde Position auf der Warteliste
-                    waitlist_position = "unbekannt"
-                    for i, entry in enumerate(event["waitlist"]):
-                        if using_waitlist_ids:
-                            if len(entry) >= 3 and entry[0].lower() == team_name.lower():
-                                waitlist_position = i + 1
-                                break
-                        else:
-                            if entry[0].lower() == team_name.lower():
-                                waitlist_position = i + 1
-                                break
-                    
-                    user_results.append(f"👤 **{user.name}** (ID: {user.id}) ist in Team **{team_name}** (Warteliste Position {waitlist_position}, Größe: {total_size})")
-        except Exception as e:
-            # Bei Fehler einfach überspringen
-            logger.error(f"Fehler beim Suchen des Benutzers {user_id}: {e}")
-            pass
-    
-    # Kombiniere die Ergebnisse
-    results.extend(user_results)
+                    line = f"👤 **{user.name}** (ID: {user.id}) ist in Team **{team_name}** (Warteliste Position {waitlist_position}, Größe: {total_size})"
+                else:
+                    continue
+            except Exception as e:
+                # Bei Fehler einfach überspringen
+                logger.error(f"Fehler beim Suchen des Benutzers {user_id}: {e}")
+                continue
+            
+            results.append(line)
+            total_len += len(line) + 1
+            if total_len >= FIND_MESSAGE_LIMIT:
+                truncated = True
+                break
     
     if results:
         # Erstelle eine Nachricht mit allen Ergebnissen
-        message = f"**🔍 Suchergebnisse für '{search_term}':**\n\n" + "\n".join(results)
+        message = header + "\n".join(results)
         
-        # Wenn die Nachricht zu lang ist, kürze sie
-        if len(message) > 1900:
-            message = message[:1900] + "...\n(Weitere Ergebnisse wurden abgeschnitten)"
+        # Wenn die Nachricht zu lang ist oder die Suche abgebrochen wurde, kürze sie
+        if truncated or len(message) > FIND_MESSAGE_LIMIT:
+            message = message[:FIND_MESSAGE_LIMIT] + "...\n(Weitere Ergebnisse wurden abgeschnitten)"
         
         await send_feedback(interaction, message, ephemeral=True)
     else:
@@ -4316,101 +4614,98 @@ async def find_command(interaction: discord.Interaction, search_term: str):
 
 
 
-@bot.tree.command(name="export_teams", description="Exportiert die Teamliste als CSV-Datei (nur für Orga-Team)")
-async def export_teams(interaction: discord.Interaction):
-    """Exportiert alle Teams als CSV-Datei"""
-    # Validiere den Befehlskontext (Rolle, Event)
-    event, _ = await validate_command_context(interaction, required_role=ORGANIZER_ROLE)
-    if not event:
-        return
-        
-    # Erstelle CSV-Inhalt im Speicher
-    import io
-    import csv
-    from datetime import datetime
+def _build_team_export_csv(teams, waitlist, assignments, using_team_ids, using_waitlist_ids):
+    """
+    Erstellt den CSV-Inhalt für /export_teams (läuft in einem Worker-Thread)
     
-    csv_file = io.StringIO()
-    csv_writer = csv.writer(csv_file)
+    Parameters:
+    - teams: Momentaufnahme der angemeldeten Teams
+    - waitlist: Momentaufnahme der Warteliste
+    - assignments: Momentaufnahme der Benutzer-Team-Zuweisungen als Tupel von (user_id, (team_name, team_lower))
+    - using_team_ids: Ob die Teams das erweiterte Format mit IDs verwenden
+    - using_waitlist_ids: Ob die Warteliste das erweiterte Format mit IDs verwendet
     
-    # Prüfe, ob das Team-Dictionary das erweiterte Format mit IDs verwendet
-    using_team_ids = False
-    if event["teams"] and isinstance(next(iter(event["teams"].values())), dict):
-        using_team_ids = True
+    Returns:
+    - UTF-8-kodierter CSV-Inhalt (mit BOM)
+    """
+    # CSV-Zeilen werden als Strings gesammelt und am Ende einmalig kodiert
+    rows = []
     
-    # Prüfe, ob die Warteliste das erweiterte Format mit IDs verwendet
-    using_waitlist_ids = False
-    if event["waitlist"] and len(event["waitlist"][0]) > 2:
-        using_waitlist_ids = True
+    # Team-Leiter einmalig pro Team bestimmen (erster zugewiesener Nutzer)
+    team_to_leader = {}
+    for user_id, (_, assigned_team_lower) in assignments:
+        team_to_leader.setdefault(assigned_team_lower, user_id)
     
     # Erweiterten Header für das neue Format
     if using_team_ids or using_waitlist_ids:
-        csv_writer.writerow(["Typ", "Teamname", "Größe", "Teamleiter-Discord-ID", "Team-ID", "Registrierungsdatum"])
+        rows.append("Typ,Teamname,Größe,Teamleiter-Discord-ID,Team-ID,Registrierungsdatum\r\n")
     else:
         # Standard-Header für das alte Format
-        csv_writer.writerow(["Typ", "Teamname", "Größe", "Teamleiter-Discord-ID", "Registrierungsdatum"])
+        rows.append("Typ,Teamname,Größe,Teamleiter-Discord-ID,Registrierungsdatum\r\n")
+    
+    # Teams einmalig alphabetisch sortieren (deterministische Reihenfolge im Export)
+    sorted_teams = sorted(teams.items())
     
     # Schreibe angemeldete Teams
     if using_team_ids:
         # Neues Format mit Team-IDs
-        for team_name, data in event["teams"].items():
+        for team_name, data in sorted_teams:
             size = data.get("size", 0)
             team_id = data.get("id", "keine ID")
             
-            # Finde Team-Leiter (suche ersten Nutzer mit diesem Team)
-            leader_id = "Unbekannt"
-            for user_id, assigned_team in user_team_assignments.items():
-                if assigned_team.lower() == team_name.lower():
-                    leader_id = user_id
-                    break
+            # Team-Leiter (erster Nutzer mit diesem Team)
+            leader_id = team_to_leader.get(team_name.lower(), "Unbekannt")
             
             if using_team_ids or using_waitlist_ids:
-                csv_writer.writerow(["Angemeldet", team_name, size, leader_id, team_id, ""])
+                rows.append(f"Angemeldet,{_csv_escape(team_name)},{size},{_csv_escape(leader_id)},{_csv_escape(team_id)},\r\n")
             else:
-                csv_writer.writerow(["Angemeldet", team_name, size, leader_id, ""])
+                rows.append(f"Angemeldet,{_csv_escape(team_name)},{size},{_csv_escape(leader_id)},\r\n")
     else:
         # Altes Format
-        for team_name, size in event["teams"].items():
-            # Finde Team-Leiter (suche ersten Nutzer mit diesem Team)
-            leader_id = "Unbekannt"
-            for user_id, assigned_team in user_team_assignments.items():
-                if assigned_team.lower() == team_name.lower():
-                    leader_id = user_id
-                    break
+        for team_name, size in sorted_teams:
+            # Team-Leiter (erster Nutzer mit diesem Team)
+            leader_id = team_to_leader.get(team_name.lower(), "Unbekannt")
             
-            csv_writer.writerow(["Angemeldet", team_name, size, leader_id, ""])
+            rows.append(f"Angemeldet,{_csv_escape(team_name)},{size},{_csv_escape(leader_id)},\r\n")
     
     # Schreibe Warteliste
-    if using_waitlist_ids:
-        # Neues Format mit Team-IDs
-        for i, entry in enumerate(event["waitlist"]):
-            if len(entry) >= 3:  # Format: (team_name, size, team_id)
-                team_name, size, team_id = entry
-                
-                # Finde Team-Leiter (suche ersten Nutzer mit diesem Team)
-                leader_id = "Unbekannt"
-                for user_id, assigned_team in user_team_assignments.items():
-                    if assigned_team.lower() == team_name.lower():
-                        leader_id = user_id
-                        break
-                
-                if using_team_ids or using_waitlist_ids:
-                    csv_writer.writerow(["Warteliste", team_name, size, leader_id, team_id, ""])
-                else:
-                    csv_writer.writerow(["Warteliste", team_name, size, leader_id, ""])
-    else:
-        # Altes Format
-        for i, (team_name, size) in enumerate(event["waitlist"]):
-            # Finde Team-Leiter (suche ersten Nutzer mit diesem Team)
-            leader_id = "Unbekannt"
-            for user_id, assigned_team in user_team_assignments.items():
-                if assigned_team.lower() == team_name.lower():
-                    leader_id = user_id
-                    break
-            
-            csv_writer.writerow(["Warteliste", team_name, size, leader_id, ""])
+    for entry in waitlist:
+        team_name, size, team_id = entry["team_name"], entry["size"], entry["team_id"]
+        
+        # Team-Leiter (erster Nutzer mit diesem Team)
+        leader_id = team_to_leader.get(team_name.lower(), "Unbekannt")
+        
+        if using_team_ids or using_waitlist_ids:
+            rows.append(f"Warteliste,{_csv_escape(team_name)},{size},{_csv_escape(leader_id)},{_csv_escape(team_id or 'keine ID')},\r\n")
+        else:
+            rows.append(f"Warteliste,{_csv_escape(team_name)},{size},{_csv_escape(leader_id)},\r\n")
     
-    # Zurück zum Anfang der Datei
-    csv_file.seek(0)
+    # Einmalig kodieren (mit BOM, damit Excel die Umlaute korrekt erkennt)
+    return "".join(rows).encode("utf-8-sig")
+
+@bot.tree.command(name="export_teams", description="Exportiert die Teamliste als CSV-Datei (nur für Orga-Team)")
+@organizer_only()
+async def export_teams(interaction: discord.Interaction):
+    """Exportiert alle Teams als CSV-Datei"""
+    # Validiere den Befehlskontext (Event; die Rolle prüft organizer_only)
+    event, _ = await validate_command_context(interaction)
+    if not event:
+        return
+        
+    # Format-Flags werden beim Laden/Speichern des Events gesetzt
+    using_team_ids = event.get("schema", SCHEMA_LEGACY) >= SCHEMA_V2
+    using_waitlist_ids = event.get("_waitlist_v2", False)
+    
+    # CSV im Worker-Thread erstellen; Momentaufnahmen, damit parallele Änderungen nicht stören
+    payload = await asyncio.to_thread(
+        _build_team_export_csv,
+        dict(event["teams"]),
+        list(event["waitlist"]),
+        tuple(user_team_assignments.items()),
+        using_team_ids,
+        using_waitlist_ids
+    )
+    csv_file = io.BytesIO(payload)
     
     # Aktuelle Zeit für den Dateinamen
     current_time = datetime.now().strftime("%Y-%m-%d_%H-%M")
@@ -4443,6 +4738,7 @@ async def export_teams(interaction: discord.Interaction):
     discord_name="Discord Name des Team-Representatives (optional)",
     force_waitlist="Team direkt auf die Warteliste setzen (True/False)"
 )
+@organizer_only()
 async def add_team_command(
     interaction: discord.Interaction, 
     team_name: str, 
@@ -4453,8 +4749,8 @@ async def add_team_command(
 ):
     """Fügt ein Team direkt zum Event oder zur Warteliste hinzu (Admin-Befehl)"""
     
-    # Validiere Berechtigungen (nur Organisatoren)
-    event, _ = await validate_command_context(interaction, required_role=ORGANIZER_ROLE, team_required=False)
+    # Validiere den Befehlskontext (Event; die Rolle prüft organizer_only)
+    event, _ = await validate_command_context(interaction, team_required=False)
     if not event:
         return
 
@@ -4482,7 +4778,7 @@ async def add_team_command(
     
     if success:
         # Event-Anzeige aktualisieren
-        channel = bot.get_channel(channel_id)
+        channel = get_event_channel()
         if channel:
             await update_event_displays(channel=channel)
     else:
@@ -4496,11 +4792,12 @@ async def add_team_command(
     new_size="Neue Größe des Teams",
     reason="Grund für die Änderung (optional)"
 )
+@organizer_only()
 async def admin_team_edit_command(interaction: discord.Interaction, team_name: str, new_size: int, reason: str = None):
     """Bearbeitet die Größe eines Teams (Admin-Befehl)"""
     
-    # Validiere Berechtigungen (nur Organisatoren)
-    event, _ = await validate_command_context(interaction, required_role=ORGANIZER_ROLE, team_required=False)
+    # Validiere den Befehlskontext (Event; die Rolle prüft organizer_only)
+    event, _ = await validate_command_context(interaction, team_required=False)
     if not event:
         return
 
@@ -4510,7 +4807,7 @@ async def admin_team_edit_command(interaction: discord.Interaction, team_name: s
     
     if success:
         # Event-Anzeige aktualisieren
-        channel = bot.get_channel(channel_id)
+        channel = get_event_channel()
         if channel:
             await update_event_displays(channel=channel)
     else:
@@ -4522,11 +4819,12 @@ async def admin_team_edit_command(interaction: discord.Interaction, team_name: s
 @app_commands.describe(
     team_name="Name des Teams, das entfernt werden soll"
 )
+@organizer_only()
 async def admin_team_remove_command(interaction: discord.Interaction, team_name: str):
     """Entfernt ein Team vom Event oder der Warteliste (Admin-Befehl)"""
     
-    # Validiere Berechtigungen (nur Organisatoren)
-    event, _ = await validate_command_context(interaction, required_role=ORGANIZER_ROLE, team_required=False)
+    # Validiere den Befehlskontext (Event; die Rolle prüft organizer_only)
+    event, _ = await validate_command_context(interaction, team_required=False)
     if not event:
         return
 
@@ -4537,17 +4835,18 @@ async def admin_team_remove_command(interaction: discord.Interaction, team_name:
     
     if success:
         # Event-Anzeige aktualisieren
-        channel = bot.get_channel(channel_id)
+        channel = get_event_channel()
         if channel:
             await update_event_displays(channel=channel)
 
 
 @bot.tree.command(name="admin_waitlist", description="Zeigt die vollständige Warteliste an (nur für Orga-Team)")
+@organizer_only()
 async def admin_waitlist_command(interaction: discord.Interaction):
     """Zeigt die vollständige Warteliste mit Details an (Admin-Befehl)"""
     
-    # Validiere Berechtigungen (nur Organisatoren)
-    event, _ = await validate_command_context(interaction, required_role=ORGANIZER_ROLE, team_required=False)
+    # Validiere den Befehlskontext (Event; die Rolle prüft organizer_only)
+    event, _ = await validate_command_context(interaction, team_required=False)
     if not event:
         return
     
@@ -4560,26 +4859,14 @@ async def admin_waitlist_command(interaction: discord.Interaction):
         return
     
     # Warteliste formatieren
-    waitlist_str = "## 📋 Warteliste\n\n"
+    parts = ["## 📋 Warteliste\n\n"]
     for idx, entry in enumerate(event['waitlist']):
-        # Prüfe das Format der Wartelisten-Einträge
-        if isinstance(entry, dict):
-            # Dictionary-Format (neues Format)
-            team_name = entry.get('team_name', 'Unbekannt')
-            size = entry.get('size', 0)
-            team_id = entry.get('team_id', 'N/A')
-            waitlist_str += f"**{idx+1}.** {team_name} ({size} Spieler, Team-ID: {team_id})\n"
-        elif isinstance(entry, tuple) and len(entry) >= 3:
-            # Tupel-Format mit Team-ID (team_name, size, team_id)
-            team_name, size, team_id = entry
-            waitlist_str += f"**{idx+1}.** {team_name} ({size} Spieler, Team-ID: {team_id})\n"
-        elif isinstance(entry, tuple) and len(entry) >= 2:
-            # Tupel-Format ohne Team-ID (team_name, size)
-            team_name, size = entry[:2]
-            waitlist_str += f"**{idx+1}.** {team_name} ({size} Spieler)\n"
+        team_name, size, team_id = entry["team_name"], entry["size"], entry["team_id"]
+        if team_id is not None:
+            parts.append(f"**{idx+1}.** {team_name} ({size} Spieler, Team-ID: {team_id})\n")
         else:
-            # Unbekanntes Format
-            waitlist_str += f"**{idx+1}.** {entry} (Format nicht erkannt)\n"
+            parts.append(f"**{idx+1}.** {team_name} ({size} Spieler)\n")
+    waitlist_str = "".join(parts)
     
     # Warteliste als Embed senden
     embed = discord.Embed(
@@ -4599,11 +4886,12 @@ async def admin_waitlist_command(interaction: discord.Interaction):
 
 
 @bot.tree.command(name="admin_user_assignments", description="Zeigt alle Benutzer-Team-Zuweisungen an (nur für Orga-Team)")
+@organizer_only()
 async def admin_user_assignments_command(interaction: discord.Interaction):
     """Zeigt alle Benutzer-Team-Zuweisungen an (Admin-Befehl)"""
     
-    # Validiere Berechtigungen (nur Organisatoren)
-    event, _ = await validate_command_context(interaction, required_role=ORGANIZER_ROLE, team_required=False)
+    # Validiere den Befehlskontext (Event; die Rolle prüft organizer_only)
+    event, _ = await validate_command_context(interaction, team_required=False)
     if not event:
         return
     
@@ -4618,25 +4906,28 @@ async def admin_user_assignments_command(interaction: discord.Interaction):
         return
     
     # Zuweisungen formatieren
-    assignments_str = "## 👥 Benutzer-Team-Zuweisungen\n\n"
+    parts = ["## 👥 Benutzer-Team-Zuweisungen\n\n"]
     
     # Nach Teams gruppieren
-    team_users = {}
-    for user_id, team_name in user_team_assignments.items():
-        if team_name not in team_users:
-            team_users[team_name] = []
-        
-        # Versuche den Benutzer zu holen
-        user = interaction.guild.get_member(int(user_id))
-        user_display = f"<@{user_id}> ({user.display_name if user else 'Unbekannt'})"
-        team_users[team_name].append(user_display)
+    team_users = defaultdict(list)
+    # Momentaufnahme, damit parallele Zuweisungen die Schleife nicht stören
+    assignments = tuple(user_team_assignments.items())
+    
+    # Mitglieder einmalig vor der Gruppierung aus dem lokalen Member-Cache holen (Schlüssel sind bereits int)
+    get_member = interaction.guild.get_member
+    members = {user_id: get_member(user_id) for user_id, _ in assignments}
+    
+    for user_id, (team_name, _) in assignments:
+        member = members.get(user_id)
+        team_users[team_name].append(f"<@{user_id}> ({member.display_name if member else 'Unbekannt'})")
     
     # Sortiere Teams alphabetisch
     for team_name in sorted(team_users.keys()):
-        assignments_str += f"**{team_name}**:\n"
+        parts.append(f"**{team_name}**:\n")
         for user_entry in team_users[team_name]:
-            assignments_str += f"- {user_entry}\n"
-        assignments_str += "\n"
+            parts.append(f"- {user_entry}\n")
+        parts.append("\n")
+    assignments_str = "".join(parts)
     
     # Zuweisungen als Embed senden
     embed = discord.Embed(
@@ -4659,11 +4950,12 @@ async def admin_user_assignments_command(interaction: discord.Interaction):
 @app_commands.describe(
     user="Der Benutzer, dessen ID du erhalten möchtest"
 )
+@organizer_only()
 async def admin_get_user_id_command(interaction: discord.Interaction, user: discord.User):
     """Gibt die Discord ID eines Benutzers zurück (Admin-Befehl)"""
     
-    # Validiere Berechtigungen (nur Organisatoren)
-    event, _ = await validate_command_context(interaction, required_role=ORGANIZER_ROLE, team_required=False)
+    # Validiere den Befehlskontext (Event; die Rolle prüft organizer_only)
+    event, _ = await validate_command_context(interaction, team_required=False)
     if not event:
         return
     
@@ -4674,7 +4966,7 @@ async def admin_get_user_id_command(interaction: discord.Interaction, user: disc
         f"**Discord ID:** `{user.id}`\n"
         f"**Username:** {user.name}\n"
         f"**Joined Discord am:** {user.created_at.strftime('%d.%m.%Y')}\n"
-        f"**Team:** {get_user_team(str(user.id)) or 'Kein Team zugewiesen'}",
+        f"**Team:** {get_user_team(user.id) or 'Kein Team zugewiesen'}",
         ephemeral=True
     )
 
@@ -4683,20 +4975,11 @@ async def admin_get_user_id_command(interaction: discord.Interaction, user: disc
 @app_commands.describe(
     clear_cache="Ob der Discord-API-Cache vollständig gelöscht werden soll (empfohlen bei Problemen)"
 )
+@organizer_only()
 async def sync_commands(interaction: discord.Interaction, clear_cache: bool = False):
     """Synchronisiert die Slash-Commands mit der Discord API"""
     # Kommandoausführung loggen
-    logger.info(f"Slash-Command: /sync ausgeführt von {interaction.user.name} ({interaction.user.id}) in Kanal {interaction.channel.name} mit Parameter clear_cache={clear_cache}")
-    
-    # Validiere Berechtigungen (nur Organisatoren)
-    if not has_role(interaction.user, ORGANIZER_ROLE):
-        logger.warning(f"Berechtigungsfehler: {interaction.user.name} ({interaction.user.id}) hat versucht, /sync ohne ausreichende Berechtigungen zu verwenden")
-        await send_feedback(
-            interaction,
-            f"Du benötigst die Rolle '{ORGANIZER_ROLE}', um diesen Befehl zu nutzen.",
-            ephemeral=True
-        )
-        return
+    logger.info("Slash-Command: /sync ausgeführt von %s (%s) in Kanal %s mit Parameter clear_cache=%s", interaction.user.name, interaction.user.id, interaction.channel.name, clear_cache)
     
     # Bestätigungsnachricht senden
     await send_feedback(
@@ -4711,9 +4994,7 @@ async def sync_commands(interaction: discord.Interaction, clear_cache: bool = Fa
             bot.tree.clear_commands(guild=None)
             # Änderungen an die API senden
             await bot.tree.sync()
-            # Kurz warten
-            await asyncio.sleep(2)
-            # Befehle neu laden
+            # Befehle neu laden (sync() kehrt erst nach Abschluss zurück, kein Warten nötig)
             await bot.tree._set_current_commands(reload=True)
             # Erneut synchronisieren
             await bot.tree.sync()
@@ -4723,36 +5004,33 @@ async def sync_commands(interaction: discord.Interaction, clear_cache: bool = Fa
             # Normale Synchronisierung ohne Cache-Löschung
             await bot.tree.sync()
         
-        # Log-Eintrag für erfolgreiche Synchronisierung
-        await send_to_log_channel(
-            f"🔄 Slash-Commands: Admin {interaction.user.name} hat die Slash-Commands {'mit Cache-Löschung ' if clear_cache else ''}synchronisiert",
-            level="INFO",
-            guild=interaction.guild
-        )
-        
-        await interaction.followup.send(
-            f"Slash-Commands wurden erfolgreich {'mit Cache-Löschung ' if clear_cache else ''}synchronisiert!\n"
-            f"Es kann bis zu einer Stunde dauern, bis alle Änderungen bei allen Nutzern sichtbar sind.\n\n"
-            f"Tipp: Bei Problemen im Discord-Client hilft oft ein Neustart der Discord-App.",
-            ephemeral=True
+        # Log-Eintrag und Bestätigung sind unabhängig voneinander und laufen parallel
+        results = await asyncio.gather(
+            send_to_log_channel(
+                f"🔄 Slash-Commands: Admin {interaction.user.name} hat die Slash-Commands {'mit Cache-Löschung ' if clear_cache else ''}synchronisiert",
+                level="INFO",
+                guild=interaction.guild
+            ),
+            interaction.followup.send(
+                f"Slash-Commands wurden erfolgreich {'mit Cache-Löschung ' if clear_cache else ''}synchronisiert!\n"
+                f"Es kann bis zu einer Stunde dauern, bis alle Änderungen bei allen Nutzern sichtbar sind.\n\n"
+                f"Tipp: Bei Problemen im Discord-Client hilft oft ein Neustart der Discord-App.",
+                ephemeral=True
+            ),
+            return_exceptions=True
         )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Fehler nach der Synchronisierung der Slash-Commands: %s", result)
     except Exception as e:
-        logger.error(f"Fehler bei der Synchronisierung der Slash-Commands: {e}")
+        logger.error("Fehler bei der Synchronisierung der Slash-Commands: %s", e)
         await interaction.followup.send(f"Fehler bei der Synchronisierung: {e}", ephemeral=True)
 
 @bot.tree.command(name="admin_help", description="Zeigt Hilfe zu Admin-Befehlen an (nur für Orga-Team)")
+@organizer_only()
 async def admin_help_command(interaction: discord.Interaction):
     """Zeigt Hilfe zu den verfügbaren Admin-Befehlen"""
     
-    # Validiere Berechtigungen (nur Organisatoren)
-    if not has_role(interaction.user, ORGANIZER_ROLE):
-        await send_feedback(
-            interaction,
-            f"Du benötigst die Rolle '{ORGANIZER_ROLE}', um diesen Befehl zu nutzen.",
-            ephemeral=True
-        )
-        return
-    
     # Admin Befehle als Embed senden
     embed = discord.Embed(
         title="📋 Admin-Befehle für Event-Management",
@@ -4833,20 +5111,11 @@ async def admin_help_command(interaction: discord.Interaction):
 
 # Log-Verwaltungsbefehle
 @bot.tree.command(name="export_log", description="Exportiert die Log-Datei zum Download (nur für Orga-Team)")
+@organizer_only()
 async def export_log_command(interaction: discord.Interaction):
     """Exportiert die Log-Datei"""
     # Kommandoausführung loggen
-    logger.info(f"Slash-Command: /export_log ausgeführt von {interaction.user.name} ({interaction.user.id}) in Kanal {interaction.channel.name}")
-    
-    # Validiere Berechtigungen (nur Organisatoren)
-    if not has_role(interaction.user, ORGANIZER_ROLE):
-        logger.warning(f"Berechtigungsfehler: {interaction.user.name} ({interaction.user.id}) hat versucht, /export_log ohne ausreichende Berechtigungen zu verwenden")
-        await send_feedback(
-            interaction,
-            f"Du benötigst die Rolle '{ORGANIZER_ROLE}', um diesen Befehl zu nutzen.",
-            ephemeral=True
-        )
-        return
+    logger.info("Slash-Command: /export_log ausgeführt von %s (%s) in Kanal %s", interaction.user.name, interaction.user.id, interaction.channel.name)
     
     # Log-Datei exportieren
     result = export_log_file()
@@ -4878,20 +5147,11 @@ async def export_log_command(interaction: discord.Interaction):
     )
 
 @bot.tree.command(name="clear_log", description="Löscht den Inhalt der Log-Datei (nur für Orga-Team)")
+@organizer_only()
 async def clear_log_command(interaction: discord.Interaction):
     """Löscht den Inhalt der Log-Datei"""
     # Kommandoausführung loggen
-    logger.info(f"Slash-Command: /clear_log ausgeführt von {interaction.user.name} ({interaction.user.id}) in Kanal {interaction.channel.name}")
-    
-    # Validiere Berechtigungen (nur Organisatoren)
-    if not has_role(interaction.user, ORGANIZER_ROLE):
-        logger.warning(f"Berechtigungsfehler: {interaction.user.name} ({interaction.user.id}) hat versucht, /clear_log ohne ausreichende Berechtigungen zu verwenden")
-        await send_feedback(
-            interaction,
-            f"Du benötigst die Rolle '{ORGANIZER_ROLE}', um diesen Befehl zu nutzen.",
-            ephemeral=True
-        )
-        return
+    logger.info("Slash-Command: /clear_log ausgeführt von %s (%s) in Kanal %s", interaction.user.name, interaction.user.id, interaction.channel.name)
     
     # Bestätigungsabfrage
     class ClearLogConfirmationView(BaseConfirmationView):
@@ -4941,24 +5201,84 @@ async def clear_log_command(interaction: discord.Interaction):
         view=confirm_view
     )
 
+def _attachment_check(user, channel):
+    """
+    Erstellt die Prüffunktion für bot.wait_for, die auf einen Datei-Upload des Benutzers wartet.
+    Vergleicht nur IDs, da die Prüfung für jede eingehende Nachricht ausgeführt wird.
+    
+    Parameters:
+    - user: Der Benutzer, dessen Upload erwartet wird
+    - channel: Der Kanal, in dem der Upload erwartet wird
+    
+    Returns:
+    - Prüffunktion für Nachrichten
+    """
+    expected_user_id, expected_channel_id = user.id, channel.id
+    
+    def check(message):
+        # Günstigste Prüfung zuerst: die meisten Nachrichten haben keinen Anhang
+        return (bool(message.attachments)
+                and message.author.id == expected_user_id
+                and message.channel.id == expected_channel_id)
+    
+    return check
+
+# Obergrenze für den entpackten Inhalt eines ZIP-Archivs bei /import_log
+LOG_IMPORT_MAX_UNZIPPED = 50 * 1024 * 1024
+
+async def _attachment_chunks(attachments):
+    """
+    Liefert den Inhalt mehrerer Anhänge als einen fortlaufenden Strom von Byte-Blöcken.
+    Normale Dateien werden blockweise heruntergeladen, ZIP-Archive werden entpackt
+    und alle enthaltenen Dateien nacheinander ausgegeben.
+    
+    Parameters:
+    - attachments: Liste der Discord-Anhänge
+    
+    Yields:
+    - Byte-Blöcke (wirft eine Ausnahme bei Download- oder Archivfehlern; import_log_stream
+      verwirft dann den gesamten Import, auch bereits gelesene Anhänge)
+    """
+    async with aiohttp.ClientSession() as session:
+        for attachment in attachments:
+            async with session.get(attachment.url) as resp:
+                if resp.status != 200:
+                    raise RuntimeError(f"Fehler beim Herunterladen von '{attachment.filename}': HTTP {resp.status}")
+                
+                if not attachment.filename.lower().endswith(".zip"):
+                    async for chunk in resp.content.iter_chunked(LOG_IMPORT_CHUNK_SIZE):
+                        yield chunk
+                    continue
+                
+                # ZIP-Archive benötigen wahlfreien Zugriff und werden daher vollständig geladen (max. 10 MB)
+                data = await resp.read()
+            
+            # Einlesen und Entpacken kostet CPU-Zeit und läuft daher in einem Hilfsthread
+            archive = await asyncio.to_thread(zipfile.ZipFile, io.BytesIO(data))
+            with archive:
+                members = [info for info in archive.infolist() if not info.is_dir()]
+                if sum(info.file_size for info in members) > LOG_IMPORT_MAX_UNZIPPED:
+                    raise ValueError(f"Der entpackte Inhalt von '{attachment.filename}' ist zu groß")
+                
+                for info in members:
+                    with await asyncio.to_thread(archive.open, info) as member:
+                        while True:
+                            chunk = await asyncio.to_thread(member.read, LOG_IMPORT_CHUNK_SIZE)
+                            if not chunk:
+                                break
+                            yield chunk
+                    # Dateien im Archiv durch Zeilenumbruch trennen
+                    yield b"\n"
+
 @bot.tree.command(name="import_log", description="Importiert eine Log-Datei (nur für Orga-Team)")
 @app_commands.describe(
     append="Ob die importierte Datei an die bestehende Log-Datei angehängt (True) oder die bestehende überschrieben werden soll (False)"
 )
+@organizer_only()
 async def import_log_command(interaction: discord.Interaction, append: bool = True):
     """Importiert eine Log-Datei"""
-    # Kommandoausführung loggen
-    logger.info(f"Slash-Command: /import_log ausgeführt von {interaction.user.name} ({interaction.user.id}) in Kanal {interaction.channel.name} mit Parameter append={append}")
-    
-    # Validiere Berechtigungen (nur Organisatoren)
-    if not has_role(interaction.user, ORGANIZER_ROLE):
-        logger.warning(f"Berechtigungsfehler: {interaction.user.name} ({interaction.user.id}) hat versucht, /import_log ohne ausreichende Berechtigungen zu verwenden")
-        await send_feedback(
-            interaction,
-            f"Du benötigst die Rolle '{ORGANIZER_ROLE}', um diesen Befehl zu nutzen.",
-            ephemeral=True
-        )
-        return
+    # Kommandoausführung loggen (Berechtigung wurde bereits durch organizer_only geprüft)
+    logger.info("Slash-Command: /import_log ausgeführt von %s (%s) in Kanal %s mit Parameter append=%s", interaction.user.name, interaction.user.id, interaction.channel.name, append)
     
     # Aufforderung zum Hochladen einer Datei
     await send_feedback(
@@ -4972,7 +5292,7 @@ async def import_log_command(interaction: discord.Interaction, append: bool = Tr
     try:
         response_message = await bot.wait_for(
             "message",
-            check=lambda m: m.author == interaction.user and m.channel == interaction.channel and m.attachments,
+            check=_attachment_check(interaction.user, interaction.channel),
             timeout=300  # 5 Minuten Timeout
         )
         
@@ -4985,49 +5305,46 @@ async def import_log_command(interaction: discord.Interaction, append: bool = Tr
             )
             return
         
-        # Hole die erste Datei
-        attachment = response_message.attachments[0]
+        # Alle angehängten Dateien verarbeiten
+        attachments = response_message.attachments
         
-        # Prüfe die Dateigröße (max. 10 MB)
-        if attachment.size > 10 * 1024 * 1024:
+        # Prüfe die Dateigröße (max. 10 MB pro Datei)
+        too_large = [a.filename for a in attachments if a.size > 10 * 1024 * 1024]
+        if too_large:
             await send_feedback(
                 interaction,
-                "Die Datei ist zu groß (max. 10 MB erlaubt). Der Import wurde abgebrochen.",
+                f"Zu große Datei(en): {', '.join(too_large)} (max. 10 MB erlaubt). Der Import wurde abgebrochen.",
                 ephemeral=True
             )
             return
         
-        # Lade den Inhalt der Datei
-        file_content = await attachment.read()
-        
-        # Importiere die Datei
-        success = import_log_file(file_content, append)
+        # Alle Dateien (auch Inhalte von ZIP-Archiven) als ein Datenstrom in die Log-Datei schreiben
+        success = await import_log_stream(_attachment_chunks(attachments), append)
+        filenames = ", ".join(f"'{a.filename}'" for a in attachments)
         
         if success:
-            await send_feedback(
-                interaction,
-                f"Die Log-Datei '{attachment.filename}' wurde erfolgreich importiert.",
-                ephemeral=True
-            )
-            
-            # Log-Eintrag für erfolgreichen Import
-            await send_to_log_channel(
+            # Log-Eintrag für erfolgreichen Import (parallel zur Rückmeldung)
+            run_in_background(send_to_log_channel(
                 f"📤 Log-Import: Admin {interaction.user.name} hat eine Log-Datei importiert (Anhangsmodus: {'Anhängen' if append else 'Überschreiben'})",
                 level="INFO",
                 guild=interaction.guild
+            ))
+            
+            await send_feedback(
+                interaction,
+                f"Die Log-Datei(en) {filenames} wurde(n) erfolgreich importiert.",
+                ephemeral=True
             )
         else:
             await send_feedback(
                 interaction,
-                "Fehler beim Importieren der Log-Datei. Bitte prüfe die Logs für Details.",
+                f"Fehler beim Importieren von {filenames}. Der Import wurde vollständig verworfen, "
+                "die bestehende Log-Datei ist unverändert. Bitte prüfe die Logs für Details.",
                 ephemeral=True
             )
         
-        # Lösche die Upload-Nachricht
-        try:
-            await response_message.delete()
-        except:
-            pass
+        # Lösche die Upload-Nachricht im Hintergrund
+        run_in_background(_safe_delete(response_message))
     
     except asyncio.TimeoutError:
         await send_feedback(
@@ -5037,18 +5354,116 @@ async def import_log_command(interaction: discord.Interaction, append: bool = Tr
         )
 
 
+# Discord erlaubt Bulk-Delete nur für bis zu 100 Nachrichten, die jünger als 14 Tage sind
+BULK_DELETE_BATCH_SIZE = 100
+BULK_DELETE_MAX_AGE = timedelta(days=14)
+
+async def bulk_delete_messages(channel, limit):
+    """
+    Löscht die letzten Nachrichten eines Kanals in Bulk-Delete-Blöcken
+    
+    Parameters:
+    - channel: Der Kanal, in dem gelöscht werden soll
+    - limit: Maximale Anzahl der zu löschenden Nachrichten
+    
+    Returns:
+    - Liste der gelöschten Nachrichten
+    """
+    # Etwas Puffer zur 14-Tage-Grenze, damit Discord den Bulk-Delete nicht ablehnt
+    cutoff = discord.utils.utcnow() - BULK_DELETE_MAX_AGE + timedelta(minutes=1)
+    recent, old = [], []
+    async for message in channel.history(limit=limit):
+        (recent if message.created_at > cutoff else old).append(message)
+    
+    deleted = []
+    # Jüngere Nachrichten blockweise per Bulk-Delete (ein Request pro Block)
+    for i in range(0, len(recent), BULK_DELETE_BATCH_SIZE):
+        if i:
+            await asyncio.sleep(1)
+        batch = recent[i:i + BULK_DELETE_BATCH_SIZE]
+        await channel.delete_messages(batch)
+        deleted.extend(batch)
+    
+    # Ältere Nachrichten müssen einzeln gelöscht werden
+    for message in old:
+        try:
+            await message.delete()
+            deleted.append(message)
+        except discord.NotFound:
+            pass
+        await asyncio.sleep(0.25)
+    
+    return deleted
+
+class ClearMessagesConfirmationView(BaseConfirmationView):
+    """View für die Bestätigung von /clear_messages"""
+    def __init__(self, count, reason):
+        super().__init__(title="Nachrichten löschen")
+        self.count = count
+        self.reason = reason
+    
+    @ui.button(label="Ja, löschen", style=discord.ButtonStyle.danger)
+    async def confirm_callback(self, interaction: discord.Interaction, button: ui.Button):
+        if self.check_response(interaction):
+            await self.handle_already_responded(interaction)
+            return
+        
+        try:
+            # Muss zuerst mit defer antworten, da das Löschen länger dauern kann
+            await interaction.response.defer(ephemeral=True)
+            
+            # Nachrichten löschen
+            deleted = await bulk_delete_messages(interaction.channel, self.count)
+            
+            # Log-Eintrag (parallel zur Rückmeldung)
+            log_message = f"🗑️ {len(deleted)} Nachrichten wurden in Kanal #{interaction.channel.name} gelöscht durch {interaction.user.name} ({interaction.user.id})"
+            if self.reason:
+                log_message += f" - Grund: {self.reason}"
+            
+            logger.warning(log_message)
+            run_in_background(send_to_log_channel(log_message, level="WARNING", guild=interaction.guild))
+            
+            # Feedback senden
+            reason_text = f" (Grund: {self.reason})" if self.reason else ""
+            await interaction.followup.send(
+                f"✅ {len(deleted)} Nachrichten wurden gelöscht{reason_text}.",
+                ephemeral=True
+            )
+            
+        except discord.errors.Forbidden:
+            await interaction.followup.send(
+                "❌ Fehlende Berechtigung zum Löschen von Nachrichten.",
+                ephemeral=True
+            )
+        except Exception as e:
+            await interaction.followup.send(
+                f"❌ Fehler beim Löschen der Nachrichten: {e}",
+                ephemeral=True
+            )
+            logger.error("Fehler beim Löschen von Nachrichten: %s", e)
+    
+    @ui.button(label="Abbrechen", style=discord.ButtonStyle.secondary)
+    async def cancel_callback(self, interaction: discord.Interaction, button: ui.Button):
+        if self.check_response(interaction):
+            await self.handle_already_responded(interaction)
+            return
+            
+        await send_feedback(interaction, "Löschvorgang abgebrochen.", ephemeral=True)
+
+# Feste Bestandteile des Bestätigungs-Embeds für /clear_messages
+CLEAR_MESSAGES_EMBED_TEMPLATE = {
+    "title": "⚠️ Nachrichten löschen?",
+    "color": discord.Color.red().value
+}
+
 @bot.tree.command(name="clear_messages", description="Löscht die angegebene Anzahl der letzten Nachrichten im Kanal (nur für Orga-Team)")
 @app_commands.describe(
     count="Anzahl der zu löschenden Nachrichten (max. 100)",
     reason="Optionaler Grund für die Löschung"
 )
+@organizer_only()
 async def clear_messages_command(interaction: discord.Interaction, count: int, reason: str = None):
     """Löscht die angegebene Anzahl der letzten Nachrichten im Kanal (Admin-Befehl)"""
-    # Validiere Berechtigungen (nur Organisatoren)
-    if not has_role(interaction.user, ORGANIZER_ROLE):
-        await send_feedback(interaction, f"Nur Mitglieder mit der Rolle '{ORGANIZER_ROLE}' können diese Aktion ausführen.", ephemeral=True)
-        return
-    
     # Validiere die Anzahl der zu löschenden Nachrichten
     if count <= 0:
         await send_feedback(interaction, "Die Anzahl der zu löschenden Nachrichten muss größer als 0 sein.", ephemeral=True)
@@ -5058,68 +5473,13 @@ async def clear_messages_command(interaction: discord.Interaction, count: int, r
         await send_feedback(interaction, "Aus Sicherheitsgründen können maximal 100 Nachrichten gleichzeitig gelöscht werden.", ephemeral=True)
         return
     
-    class ClearMessagesConfirmationView(BaseConfirmationView):
-        def __init__(self, count, reason):
-            super().__init__(title="Nachrichten löschen")
-            self.count = count
-            self.reason = reason
-        
-        @ui.button(label="Ja, löschen", style=discord.ButtonStyle.danger)
-        async def confirm_callback(self, interaction: discord.Interaction, button: ui.Button):
-            if self.check_response(interaction):
-                await self.handle_already_responded(interaction)
-                return
-            
-            try:
-                # Muss zuerst mit defer antworten, da das Löschen länger dauern kann
-                await interaction.response.defer(ephemeral=True)
-                
-                # Nachrichten löschen
-                deleted = await interaction.channel.purge(limit=self.count)
-                
-                # Feedback senden
-                reason_text = f" (Grund: {self.reason})" if self.reason else ""
-                await interaction.followup.send(
-                    f"✅ {len(deleted)} Nachrichten wurden gelöscht{reason_text}.",
-                    ephemeral=True
-                )
-                
-                # Log-Eintrag
-                log_message = f"🗑️ {len(deleted)} Nachrichten wurden in Kanal #{interaction.channel.name} gelöscht durch {interaction.user.name} ({interaction.user.id})"
-                if self.reason:
-                    log_message += f" - Grund: {self.reason}"
-                
-                logger.warning(log_message)
-                await send_to_log_channel(log_message, level="WARNING", guild=interaction.guild)
-                
-            except discord.errors.Forbidden:
-                await interaction.followup.send(
-                    "❌ Fehlende Berechtigung zum Löschen von Nachrichten.",
-                    ephemeral=True
-                )
-            except Exception as e:
-                await interaction.followup.send(
-                    f"❌ Fehler beim Löschen der Nachrichten: {e}",
-                    ephemeral=True
-                )
-                logger.error(f"Fehler beim Löschen von Nachrichten: {e}")
-        
-        @ui.button(label="Abbrechen", style=discord.ButtonStyle.secondary)
-        async def cancel_callback(self, interaction: discord.Interaction, button: ui.Button):
-            if self.check_response(interaction):
-                await self.handle_already_responded(interaction)
-                return
-                
-            await send_feedback(interaction, "Löschvorgang abgebrochen.", ephemeral=True)
-    
-    # Bestätigungsdialog anzeigen
+    # Bestätigungsdialog anzeigen (nur die Beschreibung ist dynamisch)
     reason_text = f"\nGrund: **{reason}**" if reason else ""
-    embed = discord.Embed(
-        title="⚠️ Nachrichten löschen?",
-        description=f"Bist du sicher, dass du **{count} Nachrichten** in diesem Kanal löschen möchtest?{reason_text}\n\n"
-                   f"Diese Aktion kann nicht rückgängig gemacht werden!",
-        color=discord.Color.red()
-    )
+    embed = discord.Embed.from_dict({
+        **CLEAR_MESSAGES_EMBED_TEMPLATE,
+        "description": f"Bist du sicher, dass du **{count} Nachrichten** in diesem Kanal löschen möchtest?{reason_text}\n\n"
+                       f"Diese Aktion kann nicht rückgängig gemacht werden!"
+    })
     
     # Erstelle die Bestätigungsansicht
     view = ClearMessagesConfirmationView(count, reason)
@@ -5127,13 +5487,11 @@ async def clear_messages_command(interaction: discord.Interaction, count: int, r
 
 
 @bot.tree.command(name="test", description="Führt die Test-Suite aus (nur für Orga-Team)")
+@organizer_only()
 async def test_command(interaction: discord.Interaction):
     """Führt die Test-Suite aus der Test/test.py auf dem Discord aus"""
-    # Validiere Berechtigungen (nur Organisatoren)
-    if not has_role(interaction.user, ORGANIZER_ROLE):
-        await send_feedback(interaction, f"Nur Mitglieder mit der Rolle '{ORGANIZER_ROLE}' können diese Aktion ausführen.", ephemeral=True)
-        return
-    
+    output_path = None
+    proc = None
     try:
         # Informiere den Benutzer, dass Tests gestartet werden
         await send_feedback(
@@ -5143,109 +5501,77 @@ async def test_command(interaction: discord.Interaction):
             ephemeral=True
         )
         
-        # Importiere test.py Funktionen manuell über sys.path
-        import os
-        current_dir = os.getcwd()
-        test_module_path = os.path.join(current_dir, "Test")
-        sys.path.insert(0, test_module_path)
-        
-        # Import von test-Funktionen
-        try:
-            from test import run_test_suite
-        except ImportError:
-            # Alternative: Direkt auf das Test-Skript zugreifen
-            logger.warning("Konnte run_test_suite nicht importieren, versuche direkten Zugriff")
-            import subprocess
-            
-            def run_test_suite():
-                """Ersatz-Funktion, die das test.py Skript direkt aufruft"""
-                result = subprocess.run(["python", "Test/test.py"], capture_output=True, text=True)
-                if result.returncode != 0:
-                    logger.warning(f"Test-Script beendet mit Exit-Code {result.returncode}")
-                    if result.stderr:
-                        logger.error(f"Test-Fehlermeldung: {result.stderr}")
-                return result.stdout
-        
-        # Stelle globale Variablen für die Daten-Wiederherstellung sicher
-        global event_data, user_team_assignments, channel_id
-        
-        # Sichern der aktuellen Daten
-        event_data_backup = copy.deepcopy(event_data)
-        user_team_assignments_backup = copy.deepcopy(user_team_assignments)
-        
-        # Umleitung der stdout in eine StringIO, um die Ausgabe zu erfassen
-        original_stdout = sys.stdout
-        test_output = io.StringIO()
-        sys.stdout = test_output
-        
-        try:
-            # Führe die Test-Suite aus, aber mit Timeout
-            import threading
-            import time
-            
-            def run_test_with_timeout():
-                try:
-                    run_test_suite()
-                except Exception as e:
-                    logger.error(f"Fehler in der Test-Suite: {e}")
-            
-            # Starte Test in separatem Thread
-            test_thread = threading.Thread(target=run_test_with_timeout)
-            test_thread.daemon = True
-            test_thread.start()
+        # Test-Suite in einem eigenen Prozess ausführen: blockiert die Event-Loop nicht,
+        # verändert weder sys.stdout noch die Bot-Daten und lässt sich sicher abbrechen.
+        # Die Ausgabe geht direkt in eine temporäre Datei, die discord.py von der Platte sendet.
+        with tempfile.NamedTemporaryFile('wb', suffix='.txt', delete=False) as output_file:
+            output_path = output_file.name
+            proc = await asyncio.create_subprocess_exec(
+                sys.executable, TEST_SCRIPT_PATH,
+                stdout=output_file,
+                stderr=asyncio.subprocess.STDOUT
+            )
             
             # Warte maximal 30 Sekunden
-            test_thread.join(timeout=30)
-            
-            # Prüfe, ob der Test noch läuft
-            if test_thread.is_alive():
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=30)
+                if proc.returncode != 0:
+                    logger.warning("Test-Script beendet mit Exit-Code %s", proc.returncode)
+            except asyncio.TimeoutError:
                 logger.warning("Test-Suite Timeout nach 30 Sekunden - Test wird abgebrochen")
-                # Test-Ausgabe trotzdem abrufen
-                output = test_output.getvalue() + "\n\n*** TIMEOUT: Test wurde nach 30 Sekunden abgebrochen! ***"
-            else:
-                # Test-Ausgabe abrufen
-                output = test_output.getvalue()
-            
-            # Loggen des Ergebnisses
-            logger.info(f"Test-Suite ausgeführt von {interaction.user.name} ({interaction.user.id})")
-            
-            # Ausgabe für Log hinzufügen
-            log_message = f"🧪 Test-Suite ausgeführt von {interaction.user.name} ({interaction.user.id})"
-            await send_to_log_channel(log_message, level="INFO", guild=interaction.guild)
-            
-            # Erstelle eine temporäre Datei mit den Testergebnissen
-            buffer = io.BytesIO(output.encode('utf-8'))
-            buffer.seek(0)
-            
+                proc.kill()
+                await proc.wait()
+                output_file.write(b"\n\n*** TIMEOUT: Test wurde nach 30 Sekunden abgebrochen! ***")
+        
+        # Loggen des Ergebnisses
+        logger.info("Test-Suite ausgeführt von %s (%s)", interaction.user.name, interaction.user.id)
+        
+        # Ausgabe für Log hinzufügen
+        log_message = f"🧪 Test-Suite ausgeführt von {interaction.user.name} ({interaction.user.id})"
+        run_in_background(send_to_log_channel(log_message, level="INFO", guild=interaction.guild))
+        
+        try:
             # Sende die Datei als Attachment
-            file = discord.File(fp=buffer, filename="test_results.txt")
+            file = discord.File(output_path, filename="test_results.txt")
             await interaction.followup.send(
                 content="✅ **Test-Suite abgeschlossen!**\nHier sind die Ergebnisse:",
                 file=file,
                 ephemeral=True
             )
-            
-        except Exception as e:
-            # Fehlerbehandlung
+        except discord.HTTPException as e:
+            # Ergebnis konnte nicht gesendet werden (z.B. Datei zu groß)
             error_message = f"❌ **Fehler bei der Ausführung der Test-Suite:**\n```{str(e)}```"
-            logger.error(f"Fehler bei der Ausführung der Test-Suite: {e}")
+            logger.error("Fehler bei der Ausführung der Test-Suite: %s", e)
             await interaction.followup.send(content=error_message, ephemeral=True)
-        finally:
-            # Zurücksetzen von stdout und Wiederherstellung der ursprünglichen Daten
-            sys.stdout = original_stdout
-            event_data = event_data_backup
-            user_team_assignments = user_team_assignments_backup
-            
-            # Speichere die ursprünglichen Daten
-            save_data(event_data, channel_id, user_team_assignments)
     
-    except Exception as e:
-        # Allgemeine Fehlerbehandlung
+    except OSError as e:
+        # Temporäre Datei oder Test-Prozess konnte nicht angelegt werden;
+        # alle anderen Fehler behandelt on_app_command_error
         error_message = f"❌ **Fehler beim Starten der Test-Suite:**\n```{str(e)}```"
-        logger.error(f"Fehler beim Starten der Test-Suite: {e}")
+        logger.error("Fehler beim Starten der Test-Suite: %s", e)
         await send_feedback(interaction, error_message, ephemeral=True)
+    
+    finally:
+        # Test-Prozess beenden, falls der Befehl währenddessen abgebrochen wurde
+        if proc is not None and proc.returncode is None:
+            proc.kill()
+        # Temporäre Datei in jedem Fall entfernen
+        if output_path is not None:
+            try:
+                os.unlink(output_path)
+            except OSError:
+                pass
 
 # Start the bot
 if __name__ == "__main__":
+    # uvloop als schnellere Event-Loop verwenden, falls installiert (nicht unter Windows verfügbar)
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            logger.info("uvloop aktiviert")
+        except ImportError:
+            pass
+    
     logger.info("Starting bot...")
     bot.run(TOKEN)
\ No newline at end of file
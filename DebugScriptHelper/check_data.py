@@ -60,7 +60,13 @@ def check_data(pkl_file='event_data.pkl', json_output=False, detailed=False):
                     
                     result["event"]["waitlist"] = []
                     for entry in event.get('waitlist', []):
-                        if len(entry) >= 3:  # Neues Format: (team_name, size, team_id)
+                        if isinstance(entry, dict):  # Aktuelles Format: {"team_name", "size", "team_id"}
+                            result["event"]["waitlist"].append({
+                                "team_name": entry["team_name"],
+                                "size": entry["size"],
+                                "team_id": entry.get("team_id")
+                            })
+                        elif len(entry) >= 3:  # Tupel-Format: (team_name, size, team_id)
                             result["event"]["waitlist"].append({
                                 "team_name": entry[0],
                                 "size": entry[1],
@@ -80,7 +86,11 @@ def check_data(pkl_file='event_data.pkl', json_output=False, detailed=False):
         result["channel_id"] = data.get('channel_id')
         
         # Benutzer-Team-Zuweisungen
-        user_team_assignments = data.get('user_team_assignments', {})
+        # Werte sind (team_name, team_name_lower)-Tupel, in älteren Speicherständen nur der Teamname
+        user_team_assignments = {
+            user_id: team if isinstance(team, str) else team[0]
+            for user_id, team in data.get('user_team_assignments', {}).items()
+        }
         result["user_team_assignments_count"] = len(user_team_assignments)
         if detailed:
             result["user_team_assignments"] = user_team_assignments
@@ -121,7 +131,7 @@ def check_data(pkl_file='event_data.pkl', json_output=False, detailed=False):
                     for i, entry in enumerate(result["event"]["waitlist"]):
                         team_name = entry.get("team_name", "?")
                         size = entry.get("size", "?")
-                        team_id = entry.get("team_id", "keine ID")
+                        team_id = entry.get("team_id") or "keine ID"
                         print(f"  {i+1}. {team_name} (Größe: {size}, ID: {team_id})")
             else:
                 print("Kein aktives Event gefunden.")
@@ -6,6 +6,9 @@ import logging
 import asyncio
 import threading
 import shutil
+import tempfile
+import codecs
+import bisect
 from datetime import datetime
 import discord
 from discord import Embed
@@ -161,7 +164,14 @@ def load_data():
             with open(SAVE_FILE, 'rb') as f:
                 data = pickle.load(f)
                 logger.info(f"Data loaded from {SAVE_FILE}")
-                return data.get('event_data', {}), data.get('channel_id'), data.get('user_team_assignments', {})
+                event_data = data.get('event_data', {})
+                refresh_event_metadata(event_data.get('event'))
+                # Ältere Speicherstände verwenden String-IDs als Schlüssel und nur den Teamnamen als Wert
+                user_team_assignments = {
+                    int(k): (v, v.lower()) if isinstance(v, str) else tuple(v)
+                    for k, v in data.get('user_team_assignments', {}).items()
+                }
+                return event_data, data.get('channel_id'), user_team_assignments
         else:
             logger.info("No save file found, starting with empty data")
             return {}, None, {}
@@ -169,16 +179,34 @@ def load_data():
         logger.error(f"Error loading data: {e}")
         return {}, None, {}
 
+# Abgeleitete Event-Schlüssel ohne Unterstrich, die beim Laden neu berechnet werden
+DERIVED_EVENT_KEYS = frozenset({"schema"})
+
+def _persistable_event_data(event_data):
+    """
+    Liefert eine flache Kopie der Event-Daten ohne die abgeleiteten Laufzeit-Caches
+    (Schlüssel mit Unterstrich und DERIVED_EVENT_KEYS); diese baut refresh_event_metadata beim Laden neu auf
+    """
+    event = event_data.get('event')
+    if not event:
+        return event_data
+    stripped = {
+        key: value for key, value in event.items()
+        if not key.startswith('_') and key not in DERIVED_EVENT_KEYS
+    }
+    return {**event_data, 'event': stripped}
+
 def save_data(event_data, channel_id, user_team_assignments):
     """Save event data to pickle file"""
     try:
+        refresh_event_metadata(event_data.get('event'))
         data = {
-            'event_data': event_data,
+            'event_data': _persistable_event_data(event_data),
             'channel_id': channel_id,
             'user_team_assignments': user_team_assignments
         }
         with open(SAVE_FILE, 'wb') as f:
-            pickle.dump(data, f)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
         logger.info(f"Data saved to {SAVE_FILE}")
         return True
     except Exception as e:
@@ -243,6 +271,16 @@ def parse_date(date_str):
     except ValueError:
         return None
 
+def parse_date_fast(date_str):
+    """Parse date string in format DD.MM.YYYY without strptime; falls back to parse_date for other inputs"""
+    if (len(date_str) == 10 and date_str[2] == '.' and date_str[5] == '.'
+            and date_str[:2].isdigit() and date_str[3:5].isdigit() and date_str[6:].isdigit()):
+        try:
+            return datetime(int(date_str[6:]), int(date_str[3:5]), int(date_str[:2]))
+        except ValueError:
+            pass
+    return parse_date(date_str)
+
 def format_event_details(event):
     """Format event details as Discord embed"""
     if not event:
@@ -293,7 +331,8 @@ def format_event_details(event):
     # Add waitlist if exists
     if event['waitlist']:
         waitlist_text = ""
-        for i, (team_name, size) in enumerate(event['waitlist']):
+        for i, entry in enumerate(event['waitlist']):
+            team_name, size = entry["team_name"], entry["size"]
             waitlist_text += f"{i+1}. **{team_name}**: {size} {'Person' if size == 1 else 'Personen'}\n"
         
         embed.add_field(
@@ -333,7 +372,8 @@ def format_event_list(event):
     
     if event['waitlist']:
         text += f"\n⏳ Warteliste ({len(event['waitlist'])}):\n"
-        for i, (team_name, size) in enumerate(event['waitlist']):
+        for i, entry in enumerate(event['waitlist']):
+            team_name, size = entry["team_name"], entry["size"]
             text += f"{i+1}. {team_name}: {size} {'Person' if size == 1 else 'Personen'}\n"
     
     return text
@@ -413,62 +453,99 @@ def clear_log_file():
         logger.error(f"Fehler beim Löschen der Log-Datei: {e}")
         return False
 
-def import_log_file(file_content, append=True):
-    """Importiert den Inhalt einer Log-Datei.
+def _backup_log_before_import():
+    """Erstellt ein Backup der aktuellen Log-Datei, bevor sie durch einen Import ersetzt wird"""
+    if not os.path.exists(LOG_FILE_PATH):
+        return
+    
+    # Backup-Ordner erstellen, falls nicht vorhanden
+    if not os.path.exists(LOG_BACKUP_FOLDER):
+        os.makedirs(LOG_BACKUP_FOLDER)
+    
+    # Zeitstempel für den Backup-Dateinamen
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    backup_filename = f"{LOG_BACKUP_FOLDER}/log_backup_before_import_{timestamp}.log"
+    
+    # Backup erstellen
+    shutil.copy2(LOG_FILE_PATH, backup_filename)
+    logger.info(f"Backup vor Import erstellt: {backup_filename}")
+
+def _commit_log_import(temp_path, append):
+    """Überträgt einen vollständig empfangenen Import aus der temporären Datei in die Log-Datei"""
+    # Backup der aktuellen Log-Datei erstellen, falls sie überschrieben werden soll
+    if not append:
+        _backup_log_before_import()
+    
+    # Inhalt kopieren statt die Datei zu ersetzen, damit der FileHandler des Loggers
+    # weiterhin in dieselbe Datei schreibt
+    with open(temp_path, 'r') as src, open(LOG_FILE_PATH, 'a' if append else 'w') as dst:
+        shutil.copyfileobj(src, dst)
+
+async def import_log_stream(chunks, append=True):
+    """Importiert eine Log-Datei blockweise aus einem asynchronen Datenstrom.
+    
+    Dabei liegt nie die ganze Datei im Speicher, sondern immer nur der aktuelle Block.
+    Die Daten werden zunächst in eine temporäre Datei geschrieben; die Log-Datei wird
+    erst verändert, wenn der Datenstrom vollständig und fehlerfrei empfangen wurde.
+    Alle Dateizugriffe laufen in einem Hilfsthread, damit langsame Datenträger
+    den Event-Loop nicht blockieren.
     
     Parameters:
-    - file_content: Inhalt der zu importierenden Log-Datei (Bytes)
+    - chunks: Asynchroner Iterator über Byte-Blöcke (z.B. aiohttp StreamReader.iter_chunked)
     - append: Ob der Inhalt an die bestehende Log-Datei angehängt werden soll (True)
               oder die bestehende überschrieben werden soll (False)
     
     Returns:
-    - True bei Erfolg, False bei Fehler
+    - True bei Erfolg, False bei Fehler (die Log-Datei bleibt dann unverändert)
     """
+    temp_path = None
     try:
-        # Modus basierend auf append-Parameter
-        mode = 'a' if append else 'w'
+        # Inkrementeller Decoder, damit an Blockgrenzen geteilte UTF-8-Zeichen korrekt bleiben
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
         
-        # Backup der aktuellen Log-Datei erstellen, falls sie überschrieben werden soll
-        if not append and os.path.exists(LOG_FILE_PATH):
-            # Backup-Ordner erstellen, falls nicht vorhanden
-            if not os.path.exists(LOG_BACKUP_FOLDER):
-                os.makedirs(LOG_BACKUP_FOLDER)
-            
-            # Zeitstempel für den Backup-Dateinamen
-            timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-            backup_filename = f"{LOG_BACKUP_FOLDER}/log_backup_before_import_{timestamp}.log"
-            
-            # Backup erstellen
-            shutil.copy2(LOG_FILE_PATH, backup_filename)
-            logger.info(f"Backup vor Import erstellt: {backup_filename}")
-        
-        # Inhalt in die Log-Datei schreiben
-        with open(LOG_FILE_PATH, mode) as f:
-            if mode == 'w':
-                # Neue Dateien beginnen mit einer Startmeldung
-                f.write(f"--- Importierte Log-Datei: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ---\n")
-            else:
+        # Temporäre Datei im Log-Verzeichnis anlegen
+        log_dir = os.path.dirname(os.path.abspath(LOG_FILE_PATH))
+        f = await asyncio.to_thread(
+            tempfile.NamedTemporaryFile, 'w', suffix='.log', dir=log_dir, delete=False
+        )
+        temp_path = f.name
+        try:
+            if append:
                 # Beim Anhängen eine Trennlinie einfügen
-                f.write(f"\n--- Beginn importierter Logs: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ---\n")
-            
-            # Inhalt als Text konvertieren, falls er als Bytes vorliegt
-            if isinstance(file_content, bytes):
-                text_content = file_content.decode('utf-8', errors='replace')
+                header = f"\n--- Beginn importierter Logs: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ---\n"
             else:
-                text_content = file_content
-                
-            f.write(text_content)
+                # Neue Dateien beginnen mit einer Startmeldung
+                header = f"--- Importierte Log-Datei: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ---\n"
+            await asyncio.to_thread(f.write, header)
             
-            if mode == 'a':
+            async for chunk in chunks:
+                await asyncio.to_thread(f.write, decoder.decode(chunk))
+            
+            tail = decoder.decode(b'', final=True)
+            if append:
                 # Beim Anhängen eine Endmarkierung einfügen
-                f.write(f"\n--- Ende importierter Logs: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ---\n")
+                tail += f"\n--- Ende importierter Logs: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ---\n"
+            await asyncio.to_thread(f.write, tail)
+        finally:
+            await asyncio.to_thread(f.close)
+        
+        # Erst jetzt ist der Import vollständig und wird in die Log-Datei übernommen
+        await asyncio.to_thread(_commit_log_import, temp_path, append)
         
         logger.info("Log-Datei erfolgreich importiert")
         return True
     
     except Exception as e:
-        logger.error(f"Fehler beim Importieren der Log-Datei: {e}")
+        logger.error(f"Fehler beim Importieren der Log-Datei (Log-Datei bleibt unverändert): {e}")
         return False
+    
+    finally:
+        # Temporäre Datei in jedem Fall entfernen
+        if temp_path is not None:
+            try:
+                await asyncio.to_thread(os.unlink, temp_path)
+            except OSError:
+                pass
 
 
 # Hilfsfunktionen zur Formaterkennung
@@ -502,5 +579,145 @@ def is_using_waitlist_ids(event):
     if not event or not event.get("waitlist") or not isinstance(event["waitlist"], list) or len(event["waitlist"]) == 0:
         return False
     
-    # Prüfe das Format der Wartelisten-Einträge
-    return len(event["waitlist"][0]) > 2
\ No newline at end of file
+    # Prüfe, ob der erste Wartelisten-Eintrag eine Team-ID trägt
+    return normalize_waitlist_entry(event["waitlist"][0])["team_id"] is not None
+
+def make_waitlist_entry(team_name, size, team_id=None):
+    """
+    Erstellt einen Wartelisten-Eintrag im einheitlichen Format
+    
+    Parameters:
+    - team_name: Name des Teams
+    - size: Anzahl der Spieler auf der Warteliste
+    - team_id: ID des Teams (optional)
+    
+    Returns:
+    - Dictionary mit den Schlüsseln team_name, size und team_id
+    """
+    return {"team_name": team_name, "size": size, "team_id": team_id}
+
+def normalize_waitlist_entry(entry):
+    """
+    Wandelt einen Wartelisten-Eintrag im alten Tupel-Format ((team_name, size) oder
+    (team_name, size, team_id)) in das einheitliche Dictionary-Format um
+    
+    Parameters:
+    - entry: Wartelisten-Eintrag (Tupel oder Dictionary)
+    
+    Returns:
+    - Wartelisten-Eintrag als Dictionary
+    """
+    if isinstance(entry, dict):
+        return entry
+    return make_waitlist_entry(entry[0], entry[1], entry[2] if len(entry) >= 3 else None)
+
+def normalize_waitlist(waitlist):
+    """
+    Bringt alle Einträge einer Warteliste in das einheitliche Dictionary-Format (in-place)
+    
+    Parameters:
+    - waitlist: Liste der Wartelisten-Einträge
+    
+    Returns:
+    - Die (gleiche) Warteliste
+    """
+    if any(not isinstance(entry, dict) for entry in waitlist):
+        waitlist[:] = [normalize_waitlist_entry(entry) for entry in waitlist]
+    return waitlist
+
+# Schema-Versionen der Team-Daten
+SCHEMA_LEGACY = 1  # {team_name: size}
+SCHEMA_V2 = 2      # {team_name: {"size": ..., "id": ...}}
+
+def refresh_event_metadata(event):
+    """
+    Aktualisiert die zwischengespeicherten Metadaten eines Events
+    (Schema, Format-Flags, Wartelisten-Index und sortierte Teamnamen)
+    und bringt die Warteliste in das einheitliche Dictionary-Format.
+    Muss nach jeder Änderung an Teams oder Warteliste aufgerufen werden
+    (geschieht automatisch in load_data und save_data).
+    
+    Parameters:
+    - event: Das Event-Dictionary (oder None)
+    """
+    if not event:
+        return
+    
+    if event.get("waitlist"):
+        normalize_waitlist(event["waitlist"])
+    event["schema"] = SCHEMA_V2 if is_using_team_ids(event) else SCHEMA_LEGACY
+    event.pop("_teams_v2", None)
+    event["_waitlist_v2"] = is_using_waitlist_ids(event)
+    rebuild_waitlist_index(event)
+    get_sorted_team_names(event)
+
+def get_sorted_team_names(event):
+    """
+    Liefert die alphabetisch sortierten Teamnamen des Events. Die zwischengespeicherte
+    Liste wird dabei nur um hinzugekommene/entfernte Teams ergänzt, sodass sie auch
+    zwischen einer Änderung und dem nächsten Speichern korrekt ist.
+    
+    Parameters:
+    - event: Das Event-Dictionary
+    
+    Returns:
+    - Liste der sortierten Teamnamen
+    """
+    teams = event.get("teams") or {}
+    sorted_names = event.get("_teams_sorted")
+    if sorted_names is None:
+        sorted_names = event["_teams_sorted"] = sorted(teams)
+        return sorted_names
+    
+    known_names = set(sorted_names)
+    for name in known_names.difference(teams):
+        sorted_names.remove(name)
+    for name in teams.keys() - known_names:
+        bisect.insort(sorted_names, name)
+    return sorted_names
+
+def rebuild_waitlist_index(event):
+    """
+    Baut den Index der Warteliste neu auf: Teamname (lowercase) -> Positionen in der Warteliste
+    
+    Parameters:
+    - event: Das Event-Dictionary
+    
+    Returns:
+    - Der neue Index
+    """
+    index = {}
+    waitlist = event.get("waitlist") or []
+    for i, entry in enumerate(waitlist):
+        index.setdefault(entry["team_name"].lower(), []).append(i)
+    
+    event["_waitlist_index"] = index
+    # Stand der Warteliste, auf dem der Index beruht
+    event["_waitlist_index_rev"] = event.get("_waitlist_rev", 0)
+    return index
+
+def mark_waitlist_changed(event):
+    """
+    Markiert die Warteliste als geändert, damit der Index beim nächsten Zugriff neu aufgebaut wird.
+    Muss nach jedem Hinzufügen, Entfernen oder Ersetzen von Wartelisten-Einträgen aufgerufen werden.
+    
+    Parameters:
+    - event: Das Event-Dictionary
+    """
+    event["_waitlist_rev"] = event.get("_waitlist_rev", 0) + 1
+
+def get_waitlist_index(event):
+    """
+    Liefert den Index der Warteliste und baut ihn nur neu auf, wenn die Warteliste
+    seit dem letzten Aufbau über mark_waitlist_changed als geändert markiert wurde
+    
+    Parameters:
+    - event: Das Event-Dictionary
+    
+    Returns:
+    - Aktueller Index: Teamname (lowercase) -> Positionen in der Warteliste
+    """
+    index = event.get("_waitlist_index")
+    if index is None or event.get("_waitlist_index_rev") != event.get("_waitlist_rev", 0):
+        index = rebuild_waitlist_index(event)
+    return index